@@ -17,11 +17,10 @@ from ..dependencies import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
-
 
 def create_calculation_router(limiter: Limiter = None) -> APIRouter:
     """Create calculation router with optional rate limiting."""
+    router = APIRouter()
     
     if limiter:
         @router.post("/calculate", response_model=ImpactResponse)
@@ -1,6 +1,8 @@
 """Application constants."""
 
+import sys
 from enum import Enum
+from types import MappingProxyType
 
 
 class Environment(str, Enum):
@@ -85,7 +87,9 @@ class ModelMappings:
     Uses 'latest' versions where available for automatic updates,
     falls back to specific versions for stability.
     """
-    DEFAULT_MAPPINGS = {
+    # Read-only: shared across all configs, which take their own copy.
+    # Names are interned so lookups against interned keys compare by identity.
+    DEFAULT_MAPPINGS = MappingProxyType({sys.intern(k): sys.intern(v) for k, v in {
         # OpenAI models - EcoLogits supports these directly
         "gpt-4o": "gpt-4o",
         "gpt4o": "gpt-4o",  # Typo correction
@@ -143,15 +147,15 @@ class ModelMappings:
         # Legacy Google model names - upgrade to latest
         "gemini-1.0-pro": "gemini-2.5-pro",
         "gemini-1.5-pro-001": "gemini-2.5-pro"
-    }
+    }.items()})
 
 
 class CORSSettings:
     """CORS configuration."""
-    ALLOWED_ORIGINS = [
+    ALLOWED_ORIGINS = (
         "https://hook.eu1.make.com",
         "https://hook.us1.make.com"
-    ]
-    ALLOWED_METHODS = ["POST"]
-    ALLOWED_HEADERS = ["Content-Type", "Authorization"]
+    )
+    ALLOWED_METHODS = ("POST",)
+    ALLOWED_HEADERS = ("Content-Type", "Authorization")
     ALLOW_CREDENTIALS = False
\ No newline at end of file
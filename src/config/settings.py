@@ -1,12 +1,17 @@
 """Configuration management."""
 
 import os
-import json
+import errno
+import sys
+import shutil
 import logging
+import secrets
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Mapping, Optional
 from dataclasses import dataclass, field
 
+import orjson
+
 from .constants import (
     DefaultValues,
     ConfigKeys,
@@ -20,8 +25,19 @@ from .constants import (
 
 logger = logging.getLogger(__name__)
 
+# Module-level name so the parser can be patched on its own
+_json_loads = orjson.loads
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented, key-sorted JSON bytes.
+    
+    orjson.JSONEncodeError subclasses TypeError, like the stdlib encoder's errors.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+
 
-@dataclass
+@dataclass(slots=True)
 class SecurityConfig:
     """Security configuration."""
     enable_auth: bool = False
@@ -30,23 +46,49 @@ class SecurityConfig:
     trusted_hosts: List[str] = field(default_factory=lambda: ["*"])
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitConfig:
     """Rate limiting configuration."""
     requests_per_minute: int = DefaultValues.DEFAULT_REQUESTS_PER_MINUTE
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class CORSConfig:
     """CORS configuration."""
-    allowed_origins: List[str] = field(default_factory=lambda: CORSSettings.ALLOWED_ORIGINS)
-    allowed_methods: List[str] = field(default_factory=lambda: CORSSettings.ALLOWED_METHODS)
-    allowed_headers: List[str] = field(default_factory=lambda: CORSSettings.ALLOWED_HEADERS)
+    allowed_origins: List[str] = field(default_factory=lambda: list(CORSSettings.ALLOWED_ORIGINS))
+    allowed_methods: List[str] = field(default_factory=lambda: list(CORSSettings.ALLOWED_METHODS))
+    allowed_headers: List[str] = field(default_factory=lambda: list(CORSSettings.ALLOWED_HEADERS))
     allow_credentials: bool = CORSSettings.ALLOW_CREDENTIALS
 
 
-@dataclass
+_ENV_BY_NAME = {env.value: env for env in Environment}
+
+
+def _intern_mappings(mappings):
+    """Intern string model names in user-supplied mappings; leave anything else as is."""
+    if not isinstance(mappings, dict):
+        return mappings
+    return {
+        sys.intern(k) if type(k) is str else k: sys.intern(v) if type(v) is str else v
+        for k, v in mappings.items()
+    }
+
+
+# Section defaults that from_dict overlays user values onto. trusted_hosts is
+# left out so that every SecurityConfig gets its own list.
+_SECURITY_DEFAULTS = {
+    ConfigKeys.ENABLE_AUTH: False,
+    ConfigKeys.ENABLE_WEBHOOK_SIGNATURE: False,
+    ConfigKeys.MAX_TOKENS_PER_REQUEST: SecurityConstants.MAX_TOKEN_COUNT,
+}
+_RATE_LIMIT_DEFAULTS = {
+    ConfigKeys.REQUESTS_PER_MINUTE: DefaultValues.DEFAULT_REQUESTS_PER_MINUTE,
+    ConfigKeys.ENABLED: True,
+}
+
+
+@dataclass(slots=True)
 class AppConfig:
     """Application configuration."""
     model_mappings: Dict[str, str] = field(default_factory=lambda: ModelMappings.DEFAULT_MAPPINGS.copy())
@@ -59,19 +101,19 @@ class AppConfig:
     webhook_secret: Optional[str] = None
 
     @classmethod
-    def _get_environment(cls) -> Environment:
+    def _get_environment(cls, env: Mapping[str, str]) -> Environment:
         """Get environment with graceful handling of invalid values."""
-        env_str = os.getenv(EnvironmentVariables.ENVIRONMENT, Environment.DEVELOPMENT)
-        try:
-            return Environment(env_str)
-        except ValueError:
+        env_str = env.get(EnvironmentVariables.ENVIRONMENT, Environment.DEVELOPMENT)
+        environment = _ENV_BY_NAME.get(env_str)
+        if environment is None:
             logger.warning(f"Invalid environment value '{env_str}', defaulting to development")
             return Environment.DEVELOPMENT
+        return environment
     
     @classmethod
-    def _get_port(cls) -> int:
+    def _get_port(cls, env: Mapping[str, str]) -> int:
         """Get port with graceful handling of invalid values."""
-        port_str = os.getenv(EnvironmentVariables.PORT, str(DefaultValues.DEFAULT_PORT))
+        port_str = env.get(EnvironmentVariables.PORT, str(DefaultValues.DEFAULT_PORT))
         try:
             port = int(port_str)
             if port < 1 or port > 65535:
@@ -83,27 +125,46 @@ class AppConfig:
             return DefaultValues.DEFAULT_PORT
     
     @classmethod
-    def from_dict(cls, config_dict: Dict) -> "AppConfig":
-        """Create configuration from dictionary."""
-        security_dict = config_dict.get(ConfigKeys.SECURITY, {}) or {}
-        rate_limit_dict = config_dict.get(ConfigKeys.RATE_LIMITING, {}) or {}
+    def from_dict(cls, config_dict: Dict, env: Optional[Mapping[str, str]] = None) -> "AppConfig":
+        """Create configuration from dictionary.
+        
+        Environment settings are read from ``env``, defaulting to ``os.environ``.
+        """
+        if env is None:
+            env = os.environ
+        # Missing and null sections both fall back to the defaults
+        security_dict = config_dict.get(ConfigKeys.SECURITY) or {}
+        rate_limit_dict = config_dict.get(ConfigKeys.RATE_LIMITING) or {}
+        security = {**_SECURITY_DEFAULTS, **security_dict}
+        rate_limit = {**_RATE_LIMIT_DEFAULTS, **rate_limit_dict}
+        # Copy so configs never share the source dict's list; anything else,
+        # such as an explicit null, passes through as before
+        trusted_hosts = security_dict.get(ConfigKeys.TRUSTED_HOSTS, ["*"])
+        if isinstance(trusted_hosts, list):
+            trusted_hosts = list(trusted_hosts)
+        # An explicit empty mapping is kept as is, so test for None rather than falsiness
+        model_mappings = config_dict.get(ConfigKeys.MODEL_MAPPINGS)
+        if model_mappings is None:
+            model_mappings = ModelMappings.DEFAULT_MAPPINGS.copy()
+        else:
+            model_mappings = _intern_mappings(model_mappings)
         
         return cls(
-            model_mappings=config_dict.get(ConfigKeys.MODEL_MAPPINGS) if ConfigKeys.MODEL_MAPPINGS in config_dict else ModelMappings.DEFAULT_MAPPINGS.copy(),
+            model_mappings=model_mappings,
             security=SecurityConfig(
-                enable_auth=security_dict.get(ConfigKeys.ENABLE_AUTH, False),
-                enable_webhook_signature=security_dict.get(ConfigKeys.ENABLE_WEBHOOK_SIGNATURE, False),
-                max_tokens_per_request=security_dict.get(ConfigKeys.MAX_TOKENS_PER_REQUEST, SecurityConstants.MAX_TOKEN_COUNT),
-                trusted_hosts=security_dict.get(ConfigKeys.TRUSTED_HOSTS, ["*"])
+                enable_auth=security[ConfigKeys.ENABLE_AUTH],
+                enable_webhook_signature=security[ConfigKeys.ENABLE_WEBHOOK_SIGNATURE],
+                max_tokens_per_request=security[ConfigKeys.MAX_TOKENS_PER_REQUEST],
+                trusted_hosts=trusted_hosts
             ),
             rate_limiting=RateLimitConfig(
-                requests_per_minute=rate_limit_dict.get(ConfigKeys.REQUESTS_PER_MINUTE, DefaultValues.DEFAULT_REQUESTS_PER_MINUTE),
-                enabled=rate_limit_dict.get(ConfigKeys.ENABLED, True)
+                requests_per_minute=rate_limit[ConfigKeys.REQUESTS_PER_MINUTE],
+                enabled=rate_limit[ConfigKeys.ENABLED]
             ),
-            environment=cls._get_environment(),
-            port=cls._get_port(),
-            api_key=os.getenv(EnvironmentVariables.API_KEY),
-            webhook_secret=os.getenv(EnvironmentVariables.WEBHOOK_SECRET)
+            environment=cls._get_environment(env),
+            port=cls._get_port(env),
+            api_key=env.get(EnvironmentVariables.API_KEY),
+            webhook_secret=env.get(EnvironmentVariables.WEBHOOK_SECRET)
         )
 
     def to_dict(self) -> Dict:
@@ -128,48 +189,146 @@ class ConfigurationError(Exception):
     pass
 
 
+# First bytes a JSON document can start with, once whitespace is stripped
+_JSON_START_BYTES = frozenset(b'{["-tfn0123456789')
+
+
+def _validate_config_dict(config_dict: object) -> None:
+    """Check the shape of a parsed config file before building dataclasses from it."""
+    if not isinstance(config_dict, dict):
+        raise ConfigurationError(f"Config must be a JSON object, got {type(config_dict).__name__}")
+    for key in (ConfigKeys.MODEL_MAPPINGS, ConfigKeys.SECURITY, ConfigKeys.RATE_LIMITING):
+        value = config_dict.get(key)
+        if value is not None and not isinstance(value, dict):
+            raise ConfigurationError(f"'{key}' must be a JSON object, got {type(value).__name__}")
+
+
+# Atomic write failures that an in-place write can work around: EXDEV and
+# EBUSY from renaming over a bind mount, the rest from creating the temp file
+_IN_PLACE_WRITE_ERRNOS = frozenset({errno.EXDEV, errno.EBUSY, errno.EACCES, errno.EPERM, errno.EROFS})
+
+
 class ConfigLoader:
-    """Configuration loader with proper error handling."""
+    """Configuration loader with proper error handling.
+
+    Reads and writes ``config_file`` by default. ``source`` and ``sink``
+    replace the file with callables returning and receiving the raw JSON
+    bytes, e.g. for secrets managers or in-memory tests. A loader with a
+    ``source`` but no ``sink`` is read-only and never touches the file.
+    """
 
-    def __init__(self, config_file: str = DefaultValues.DEFAULT_CONFIG_FILE):
+    def __init__(
+        self,
+        config_file: str = DefaultValues.DEFAULT_CONFIG_FILE,
+        source: Optional[Callable[[], bytes]] = None,
+        sink: Optional[Callable[[bytes], None]] = None
+    ):
         self.config_file = Path(config_file)
+        self._source = source
+        self._sink = sink
+
+    @property
+    def _read_only(self) -> bool:
+        """Whether the config comes from a source with nowhere to write it back."""
+        return self._source is not None and self._sink is None
 
     def load(self) -> AppConfig:
         """Load configuration from file or create default."""
         try:
-            if self.config_file.exists():
-                return self._load_from_file()
-            else:
-                return self._create_default_config()
+            return self._load_from_file()
         except Exception as e:
             logger.error(f"{ErrorMessages.CONFIG_LOAD_ERROR}: {e}")
             raise ConfigurationError(f"{ErrorMessages.CONFIG_LOAD_ERROR}: {e}") from e
 
     def _load_from_file(self) -> AppConfig:
-        """Load configuration from existing file."""
+        """Load configuration from file, creating the default if it is missing."""
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config_dict = json.load(f)
+            raw = self._read().strip()
+            # Reject input that cannot start any JSON value before paying for
+            # a parse and a raised JSONDecodeError. Scalars still reach the
+            # parser so validation rejects them without overwriting the file.
+            if not raw or raw[0] not in _JSON_START_BYTES:
+                logger.warning(f"Invalid JSON in config file {self.config_file}: not a JSON document")
+                return self._create_default_config()
+            
+            # Defaults-only files are just an empty object; skip the parser for them
+            config_dict = {} if raw == b'{}' else _json_loads(raw)
+            _validate_config_dict(config_dict)
             
             # Merge with defaults to ensure all keys are present
             config = AppConfig.from_dict(config_dict)
             logger.info(f"Configuration loaded from {self.config_file}")
             return config
             
-        except json.JSONDecodeError as e:
+        except FileNotFoundError:
+            return self._create_default_config()
+        except orjson.JSONDecodeError as e:
             logger.warning(f"Invalid JSON in config file {self.config_file}: {e}")
             return self._create_default_config()
         except (IOError, OSError) as e:
             logger.warning(f"Error reading config file {self.config_file}: {e}")
             return self._create_default_config()
 
+    def _read(self) -> bytes:
+        """Read raw configuration bytes from the source or file."""
+        if self._source is not None:
+            return self._source()
+        with open(self.config_file, 'rb') as f:
+            return f.read()
+
+    def _write(self, config: AppConfig) -> None:
+        """Serialize configuration and write it to the sink or file."""
+        payload = _json_dumps(config.to_dict())
+        if self._sink is not None:
+            self._sink(payload)
+            return
+        # Resolve symlinks first so a linked config keeps its link and the
+        # target file is written.
+        path = os.path.realpath(self.config_file)
+        try:
+            self._write_replace(path, payload)
+        except OSError as e:
+            # Bind-mounted files cannot be renamed over and read-only
+            # directories refuse the temp file; write the file in place.
+            # Anything else, e.g. a full disk, would corrupt the live file.
+            if e.errno not in _IN_PLACE_WRITE_ERRNOS:
+                raise
+            logger.debug(f"Atomic write of {path} failed ({e}), writing in place")
+            with open(path, 'wb') as f:
+                f.write(payload)
+
+    @staticmethod
+    def _write_replace(path: str, payload: bytes) -> None:
+        """Write a uniquely named sibling file and rename it over ``path``.
+        
+        Readers never see a partially written config.
+        """
+        tmp_path = f"{path}.{secrets.token_hex(8)}.tmp"
+        # O_EXCL guards against reusing a name; the kernel applies the umask
+        fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            try:
+                shutil.copymode(path, tmp_path)
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
     def _create_default_config(self) -> AppConfig:
         """Create and save default configuration."""
         config = AppConfig()
+        if self._read_only:
+            return config
         
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config.to_dict(), f, indent=2)
+            self._write(config)
             logger.info(f"Created default config file: {self.config_file}")
         except (IOError, OSError) as e:
             logger.warning(f"Could not create config file {self.config_file}: {e}")
@@ -178,13 +337,14 @@ class ConfigLoader:
 
     def save(self, config: AppConfig) -> None:
         """Save configuration to file."""
+        if self._read_only:
+            raise ConfigurationError("Cannot save configuration: loader has a source but no sink")
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config.to_dict(), f, indent=2)
+            self._write(config)
             logger.info(f"Configuration saved to {self.config_file}")
         except (IOError, OSError) as e:
             logger.error(f"Error saving config file {self.config_file}: {e}")
             raise ConfigurationError(f"Error saving config file: {e}") from e
         except (TypeError, ValueError) as e:
             logger.error(f"JSON serialization error: {e}")
-            raise ConfigurationError(f"Configuration serialization failed: {e}") from e
\ No newline at end of file
+            raise ConfigurationError(f"Configuration serialization failed: {e}") from e
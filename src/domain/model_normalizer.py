@@ -1,9 +1,11 @@
 """Model name normalization for handling typos and variations."""
 
 import re
+from functools import lru_cache
 from typing import List, Tuple, Optional
 
 
+@lru_cache(maxsize=256)
 def normalize_model_name(model_name: str) -> str:
     """Normalize model name to handle common typos and variations."""
     if not model_name:
@@ -137,7 +137,7 @@ class CalculationIdService:
     @staticmethod
     def generate_id(model: str, input_tokens: int, output_tokens: int) -> str:
         """Generate secure calculation ID."""
-        data = f"{model}-{input_tokens}-{output_tokens}-{time.time()}"
+        data = f"{model}-{input_tokens}-{output_tokens}-{time.time_ns()}"
         calc_id = hashlib.sha256(data.encode()).hexdigest()[:SecurityConstants.CALCULATION_ID_LENGTH]
         return f"calc-{calc_id}"
 
@@ -3,6 +3,7 @@
 import hashlib
 import hmac
 import logging
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import HTTPException, Request
@@ -19,6 +20,12 @@ class SecurityError(Exception):
     pass
 
 
+@lru_cache(maxsize=8)
+def _webhook_hmac_template(secret: str) -> hmac.HMAC:
+    """Build the keyed HMAC-SHA256 state for a secret once; callers copy it."""
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
 def verify_api_key(config: AppConfig, credentials: Optional[HTTPAuthorizationCredentials]) -> bool:
     """Verify API key credentials."""
     if not config.security.enable_auth:
@@ -68,12 +75,10 @@ def verify_webhook_signature(config: AppConfig, request: Request, body: bytes) -
             detail=ErrorMessages.WEBHOOK_SECRET_NOT_CONFIGURED
         )
 
-    # Calculate expected signature
-    expected_signature = hmac.new(
-        config.webhook_secret.encode(),
-        body,
-        hashlib.sha256
-    ).hexdigest()
+    # Calculate expected signature from the precomputed keyed state
+    mac = _webhook_hmac_template(config.webhook_secret).copy()
+    mac.update(body)
+    expected_signature = mac.hexdigest()
 
     expected_header = f"sha256={expected_signature}"
 
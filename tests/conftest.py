@@ -1,17 +1,24 @@
 """Test configuration for refactored clean architecture."""
 
 import pytest
-import tempfile
 import json
-import os
-from pathlib import Path
+import httpx
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
-from fastapi.testclient import TestClient
 
 from src.application import create_app
+from src.api.dependencies import get_app_config, initialize_dependencies
 from src.config.settings import AppConfig, SecurityConfig, RateLimitConfig
 from src.domain.services import EcologitsRepository
 
+# Modules that tests patch by dotted path or import lazily; load them once at
+# plugin import so each xdist worker pays for them before collection.
+import ecologits.tracers.utils  # noqa: F401
+import src.api.routes.calculation  # noqa: F401
+import src.api.routes.health  # noqa: F401
+import src.domain.model_normalizer  # noqa: F401
+import src.domain.model_utils  # noqa: F401
+
 
 @pytest.fixture
 def app_config():
@@ -33,23 +40,21 @@ def app_config():
     )
 
 
-@pytest.fixture
-def mock_ecologits_repo():
-    """Mock EcologitsRepository."""
+@pytest.fixture(scope="session")
+def session_ecologits_repo():
+    """Build the mocked EcologitsRepository graph once per test session."""
     repo = MagicMock(spec=EcologitsRepository)
     
     # Mock impacts object
-    mock_impacts = MagicMock()
-    mock_impacts.energy.value.mean = 0.001234
-    mock_impacts.gwp.value.mean = 0.000567
+    mock_impacts = SimpleNamespace(
+        energy=SimpleNamespace(value=SimpleNamespace(mean=0.001234)),
+        gwp=SimpleNamespace(value=SimpleNamespace(mean=0.000567))
+    )
     
     # Mock model
     mock_model = MagicMock()
     
-    # Setup repository methods
-    repo.get_model.return_value = mock_model
-    repo.calculate_impacts.return_value = mock_impacts
-    repo.get_available_models.return_value = {
+    available_models = {
         'gpt-4o': mock_model,
         'gpt-4o-mini': mock_model,
         'claude-3-opus': mock_model,
@@ -61,48 +66,87 @@ def mock_ecologits_repo():
         'gpt-4o-2024-05-13': mock_model,
         'test-model-v1': mock_model
     }
+    return repo, mock_model, mock_impacts, available_models
+
+
+@pytest.fixture
+def mock_ecologits_repo(session_ecologits_repo):
+    """Mock EcologitsRepository, reset to its canonical behaviour for each test."""
+    repo, mock_model, mock_impacts, available_models = session_ecologits_repo
+    repo.reset_mock(side_effect=True)
+    
+    # Setup repository methods
+    repo.get_model.return_value = mock_model
+    repo.calculate_impacts.return_value = mock_impacts
+    repo.get_available_models.return_value = dict(available_models)
     # Make the mock permissive for model support
     repo.is_model_supported.return_value = True
     
     return repo
 
 
+@pytest.fixture(scope="session")
+def session_app(tmp_path_factory):
+    """Application built once per test session, with the config it was built from."""
+    # A per-session config file keeps xdist workers from racing on ./config.json
+    app = create_app(str(tmp_path_factory.mktemp("app") / "config.json"))
+    return app, get_app_config()
+
+
 @pytest.fixture
-def client(app_config, mock_ecologits_repo):
-    """FastAPI test client with mocked dependencies."""
-    with patch('src.infrastructure.ecologits_adapter.EcologitsAdapter') as mock_adapter_class:
+async def real_adapter_client(session_app):
+    """Async client for the shared session app, backed by the real EcologitsAdapter.
+    
+    Built once per session; use it for end-to-end checks against EcoLogits.
+    """
+    app, config = session_app
+    # Other tests reset or replace the global container; rebind it to this app's config
+    initialize_dependencies(config)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture
+async def mocked_repo_client(app_config, mock_ecologits_repo):
+    """Async client for an app built per test from ``app_config`` over ``mock_ecologits_repo``.
+    
+    The app is rebuilt because its middleware depends on the config; use it
+    when a test must not depend on the real EcoLogits models.
+    """
+    with patch('src.api.dependencies.EcologitsAdapter') as mock_adapter_class, \
+         patch('src.application.ConfigLoader') as mock_config_loader:
         mock_adapter_class.return_value = mock_ecologits_repo
-        
-        with patch('src.config.settings.ConfigLoader') as mock_config_loader:
-            mock_config_loader.return_value.load.return_value = app_config
-            
-            app = create_app()
-            return TestClient(app)
+        mock_config_loader.return_value.load.return_value = app_config
+        app = create_app()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
 
 
 @pytest.fixture
-def temp_config_file():
+def temp_config_file(tmp_path):
     """Create a temporary config file for testing."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        config = {
-            "model_mappings": {
-                "test-model": "test-model-v1",
-                "gpt-4o": "gpt-4o-2024-05-13"
-            },
-            "security": {
-                "enable_auth": False,
-                "enable_webhook_signature": False,
-                "max_tokens_per_request": 1000,
-                "trusted_hosts": ["*"]
-            },
-            "rate_limiting": {
-                "requests_per_minute": 100,
-                "enabled": False
-            }
+    config = {
+        "model_mappings": {
+            "test-model": "test-model-v1",
+            "gpt-4o": "gpt-4o-2024-05-13"
+        },
+        "security": {
+            "enable_auth": False,
+            "enable_webhook_signature": False,
+            "max_tokens_per_request": 1000,
+            "trusted_hosts": ["*"]
+        },
+        "rate_limiting": {
+            "requests_per_minute": 100,
+            "enabled": False
         }
-        json.dump(config, f)
-        yield Path(f.name)
-        os.unlink(f.name)
+    }
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(config))
+    return config_file
 
 
 @pytest.fixture
@@ -1,24 +1,78 @@
 """Tests for calculation routes."""
 import pytest
+from dataclasses import dataclass
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, AsyncMock
 from fastapi import Request
 from datetime import datetime, timezone
 
 from src.api.routes.calculation import create_calculation_router, _calculate_environmental_impact
 from src.domain.models import UsageRequest, CalculationResult, ImpactResponse
-from src.config.settings import AppConfig, SecurityConfig, RateLimitConfig
+from src.config.settings import SecurityConfig, RateLimitConfig
+
+# Inputs are controlled here, so skip pydantic validation when building requests
+_GPT4O_REQUEST = UsageRequest.model_construct(
+    model="gpt-4o",
+    input_tokens=1000,
+    output_tokens=500,
+    metadata={"user_id": "test", "session": "abc"}
+)
+_CLAUDE_REQUEST = UsageRequest.model_construct(
+    model="claude-3",
+    input_tokens=750,
+    output_tokens=250,
+    metadata={"test": "data"}
+)
+_TEST_MODEL_REQUEST = UsageRequest.model_construct(
+    model="test-model",
+    input_tokens=100,
+    output_tokens=50,
+    metadata={"test": "data"}
+)
+_INVALID_MODEL_ERROR = "Model name contains invalid characters: invalid@model"
+
+
+def _route_index(router):
+    """Index a router's routes by (path, method)."""
+    return {(r.path, m): r for r in router.routes for m in r.methods}
+
+
+@pytest.fixture(scope="module")
+def router_without_limiter():
+    """Calculation router built once; construction without a limiter is pure."""
+    return create_calculation_router(limiter=None)
+
+
+_FIXED_NOW = datetime(2024, 1, 15, 12, 30, 45, tzinfo=timezone.utc)
+
+
+class _FrozenDatetime:
+    """Stand-in for the route module's datetime with a fixed now()."""
+
+    @staticmethod
+    def now(tz=None):
+        # Naive when called without a timezone, so a missing tz shows in isoformat()
+        return _FIXED_NOW.astimezone(tz) if tz else _FIXED_NOW.replace(tzinfo=None)
+
+
+@dataclass
+class Deps:
+    """Collaborators of _calculate_environmental_impact, keyed by parameter name."""
+    request: Mock
+    config: SimpleNamespace
+    security_manager: Mock
+    calculation_service: Mock
+    id_service: Mock
+    authenticated: bool
 
 
 class TestCreateCalculationRouter:
     """Test calculation router creation."""
 
-    def test_create_router_without_limiter(self):
+    def test_create_router_without_limiter(self, router_without_limiter):
         """Test creating router without rate limiter."""
-        router = create_calculation_router(limiter=None)
-        assert router is not None
-        assert len(router.routes) == 1
-        assert router.routes[0].path == "/calculate"
-        assert "POST" in router.routes[0].methods
+        assert len(router_without_limiter.routes) == 1
+        assert ("/calculate", "POST") in _route_index(router_without_limiter)
 
     def test_create_router_with_limiter(self):
         """Test creating router with rate limiter."""
@@ -26,106 +80,53 @@ class TestCreateCalculationRouter:
         mock_limiter.limit.return_value = lambda func: func  # Mock decorator
         
         router = create_calculation_router(limiter=mock_limiter)
-        assert router is not None
         # Router may have multiple routes due to how FastAPI handles decorators
-        assert len(router.routes) >= 1
-        calculate_routes = [r for r in router.routes if r.path == "/calculate"]
-        assert len(calculate_routes) >= 1
-        assert "POST" in calculate_routes[0].methods
+        assert ("/calculate", "POST") in _route_index(router)
 
 
 class TestCalculateEnvironmentalImpact:
     """Test the core calculation endpoint logic."""
 
     @pytest.fixture
-    def mock_request(self):
-        """Create mock FastAPI request."""
-        request = Mock(spec=Request)
-        request.body = AsyncMock(return_value=b'{"test": "data"}')
-        return request
-
-    @pytest.fixture
-    def sample_usage_request(self):
-        """Create sample usage request."""
-        return UsageRequest(
-            model="gpt-4o",
-            input_tokens=1000,
-            output_tokens=500,
-            metadata={"user_id": "test", "session": "abc"}
-        )
-
-    @pytest.fixture
-    def mock_config(self):
-        """Create mock app config."""
-        config = Mock(spec=AppConfig)
-        config.environment = "testing"
-        return config
-
-    @pytest.fixture
-    def mock_security_manager(self):
-        """Create mock security manager."""
-        manager = Mock()
-        manager.verify_webhook_signature = Mock()
-        return manager
-
-    @pytest.fixture
-    def mock_calculation_service(self):
-        """Create mock calculation service."""
-        service = Mock()
-        service.calculate_impact.return_value = CalculationResult(
+    def deps(self):
+        """Create the preconfigured mocks the endpoint depends on."""
+        calculation_service = Mock()
+        calculation_service.calculate_impact.return_value = CalculationResult(
             energy_kwh=0.001,
             gwp_kgco2eq=0.0005,
             success=True,
             error=None
         )
-        return service
-
-    @pytest.fixture
-    def mock_id_service(self):
-        """Create mock ID service."""
-        service = Mock()
-        service.generate_id.return_value = "calc_12345"
-        return service
+        id_service = Mock()
+        id_service.generate_id.return_value = "calc_12345"
+        return Deps(
+            request=Mock(spec=Request, body=AsyncMock(return_value=b'{"test": "data"}')),
+            # The endpoint passes config through without reading it
+            config=SimpleNamespace(environment="testing"),
+            security_manager=Mock(),
+            calculation_service=calculation_service,
+            id_service=id_service,
+            authenticated=True
+        )
 
-    @pytest.fixture
-    def mock_authenticated(self):
-        """Create mock authentication result."""
-        return True
-
-    @pytest.mark.asyncio
-    async def test_calculate_environmental_impact_success(
-        self,
-        mock_request,
-        sample_usage_request,
-        mock_config,
-        mock_security_manager,
-        mock_calculation_service,
-        mock_id_service,
-        mock_authenticated
-    ):
+    async def test_calculate_environmental_impact_success(self, deps):
         """Test successful calculation."""
         result = await _calculate_environmental_impact(
-            request=mock_request,
-            usage_request=sample_usage_request,
-            config=mock_config,
-            security_manager=mock_security_manager,
-            calculation_service=mock_calculation_service,
-            id_service=mock_id_service,
-            authenticated=mock_authenticated
+            usage_request=_GPT4O_REQUEST, **vars(deps)
         )
 
         # Verify webhook signature was checked
-        mock_security_manager.verify_webhook_signature.assert_called_once()
+        deps.security_manager.verify_webhook_signature.assert_called_once()
 
         # Verify calculation was performed
-        mock_calculation_service.calculate_impact.assert_called_once_with(
+        deps.calculation_service.calculate_impact.assert_called_once_with(
             model="gpt-4o",
             input_tokens=1000,
             output_tokens=500
         )
 
         # Verify ID was generated
-        mock_id_service.generate_id.assert_called_once_with(
+        deps.id_service.generate_id.assert_called_once_with(
             model="gpt-4o",
             input_tokens=1000,
             output_tokens=500
@@ -144,20 +145,10 @@ class TestCalculateEnvironmentalImpact:
         assert result.error is None
         assert result.timestamp is not None
 
-    @pytest.mark.asyncio
-    async def test_calculate_environmental_impact_with_error(
-        self,
-        mock_request,
-        sample_usage_request,
-        mock_config,
-        mock_security_manager,
-        mock_calculation_service,
-        mock_id_service,
-        mock_authenticated
-    ):
+    async def test_calculate_environmental_impact_with_error(self, deps):
         """Test calculation with service error."""
         # Mock calculation service to return error
-        mock_calculation_service.calculate_impact.return_value = CalculationResult(
+        deps.calculation_service.calculate_impact.return_value = CalculationResult(
             energy_kwh=0.0,
             gwp_kgco2eq=0.0,
             success=False,
@@ -165,13 +156,7 @@ class TestCalculateEnvironmentalImpact:
         )
 
         result = await _calculate_environmental_impact(
-            request=mock_request,
-            usage_request=sample_usage_request,
-            config=mock_config,
-            security_manager=mock_security_manager,
-            calculation_service=mock_calculation_service,
-            id_service=mock_id_service,
-            authenticated=mock_authenticated
+            usage_request=_GPT4O_REQUEST, **vars(deps)
         )
 
         # Verify response includes error
@@ -181,103 +166,30 @@ class TestCalculateEnvironmentalImpact:
         assert result.energy_kwh == 0.0
         assert result.gwp_kgco2eq == 0.0
 
-    @pytest.mark.asyncio
-    async def test_timestamp_format(
-        self,
-        mock_request,
-        sample_usage_request,
-        mock_config,
-        mock_security_manager,
-        mock_calculation_service,
-        mock_id_service,
-        mock_authenticated
-    ):
+    async def test_timestamp_format(self, deps):
         """Test that timestamp is in correct ISO format."""
-        with patch('src.api.routes.calculation.datetime') as mock_datetime:
-            fixed_time = Mock()
-            fixed_time.isoformat.return_value = "2024-01-15T12:30:45+00:00"
-            mock_datetime.now.return_value = fixed_time
-            
+        with patch('src.api.routes.calculation.datetime', _FrozenDatetime):
             result = await _calculate_environmental_impact(
-                request=mock_request,
-                usage_request=sample_usage_request,
-                config=mock_config,
-                security_manager=mock_security_manager,
-                calculation_service=mock_calculation_service,
-                id_service=mock_id_service,
-                authenticated=mock_authenticated
+                usage_request=_GPT4O_REQUEST, **vars(deps)
             )
 
-            # Verify timezone-aware timestamp
-            mock_datetime.now.assert_called_with(timezone.utc)
-            assert result.timestamp == "2024-01-15T12:30:45+00:00"
-
-    @pytest.mark.asyncio
-    async def test_total_tokens_calculation(
-        self,
-        mock_request,
-        mock_config,
-        mock_security_manager,
-        mock_calculation_service,
-        mock_id_service,
-        mock_authenticated
-    ):
-        """Test that total tokens are calculated correctly."""
-        usage_request = UsageRequest(
-            model="claude-3",
-            input_tokens=750,
-            output_tokens=250,
-            metadata={"test": "data"}
-        )
+        # Verify timezone-aware timestamp
+        assert result.timestamp == "2024-01-15T12:30:45+00:00"
 
+    async def test_total_tokens_calculation(self, deps):
+        """Test that total tokens are calculated correctly."""
         result = await _calculate_environmental_impact(
-            request=mock_request,
-            usage_request=usage_request,
-            config=mock_config,
-            security_manager=mock_security_manager,
-            calculation_service=mock_calculation_service,
-            id_service=mock_id_service,
-            authenticated=mock_authenticated
+            usage_request=_CLAUDE_REQUEST, **vars(deps)
         )
 
         assert result.total_tokens == 1000  # 750 + 250
 
-    @pytest.mark.asyncio
-    async def test_security_validation_on_normalized_model(
-        self,
-        mock_request,
-        mock_config,
-        mock_security_manager,
-        mock_id_service,
-        mock_authenticated
-    ):
-        """Test that normalized model names are also security validated."""
-        from unittest.mock import Mock, patch
+    async def test_calculation_service_validation_error_propagates(self, deps):
+        """Test that a validation error from the calculation service reaches the caller."""
+        deps.calculation_service.calculate_impact.side_effect = ValueError(_INVALID_MODEL_ERROR)
         
-        # Create a usage request with a model that could normalize to something invalid
-        usage_request = UsageRequest(
-            model="test-model",
-            input_tokens=100,
-            output_tokens=50,
-            metadata={"test": "data"}
-        )
-        
-        # Mock calculation service to simulate normalization that produces invalid result
-        mock_calculation_service = Mock()
-        
-        # Mock the service to raise a security validation error
-        from src.domain.services import ImpactCalculationService
-        with patch.object(ImpactCalculationService, '_validate_model_name_security', 
-                         side_effect=ValueError("Model name contains invalid characters: invalid@model")):
-            mock_calculation_service.calculate_impact.side_effect = ValueError("Model name contains invalid characters: invalid@model")
-            
-            with pytest.raises(ValueError, match="Model name contains invalid characters"):
-                await _calculate_environmental_impact(
-                    request=mock_request,
-                    usage_request=usage_request,
-                    config=mock_config,
-                    security_manager=mock_security_manager,
-                    calculation_service=mock_calculation_service,
-                    id_service=mock_id_service,
-                    authenticated=mock_authenticated
-                )
\ No newline at end of file
+        with pytest.raises(ValueError) as exc:
+            await _calculate_environmental_impact(
+                usage_request=_TEST_MODEL_REQUEST, **vars(deps)
+            )
+        assert "Model name contains invalid characters" in str(exc.value)
@@ -1,9 +1,11 @@
 """Comprehensive tests for configuration management."""
 
 import pytest
+import errno
 import json
-import tempfile
 import os
+import stat
+import sys
 from pathlib import Path
 from unittest.mock import Mock, patch, mock_open
 from src.config.settings import AppConfig, ConfigLoader, ConfigurationError, SecurityConfig, RateLimitConfig, CORSConfig
@@ -70,6 +72,13 @@ class TestCORSConfig:
         assert "POST" in config.allowed_methods
         assert "Content-Type" in config.allowed_headers
         assert config.allow_credentials is False
+    
+    def test_cors_config_lists_not_shared(self):
+        """Test each CORSConfig owns its lists."""
+        first, second = CORSConfig(), CORSConfig()
+        first.allowed_origins.append("https://example.com")
+        
+        assert "https://example.com" not in second.allowed_origins
 
 
 class TestAppConfig:
@@ -88,6 +97,12 @@ class TestAppConfig:
         assert config.api_key is None
         assert config.webhook_secret is None
     
+    def test_config_dataclasses_use_slots(self):
+        """Test config instances carry no per-instance __dict__."""
+        config = AppConfig()
+        for instance in (config, config.security, config.rate_limiting, config.cors):
+            assert not hasattr(instance, "__dict__")
+    
     def test_app_config_from_dict_minimal(self):
         """Test AppConfig.from_dict with minimal data."""
         config_dict = {}
@@ -113,8 +128,8 @@ class TestAppConfig:
             }
         }
         
-        with patch.dict(os.environ, {"ENVIRONMENT": "production", "PORT": "9000", "API_KEY": "test-key"}):
-            config = AppConfig.from_dict(config_dict)
+        env = {"ENVIRONMENT": "production", "PORT": "9000", "API_KEY": "test-key"}
+        config = AppConfig.from_dict(config_dict, env=env)
         
         assert config.model_mappings == {"gpt-4": "gpt-4-0613"}
         assert config.security.enable_auth is True
@@ -138,9 +153,9 @@ class TestAppConfig:
         assert "enable_auth" in config_dict["security"]
         assert "requests_per_minute" in config_dict["rate_limiting"]
     
-    @patch.dict(os.environ, {"ENVIRONMENT": "invalid_env"})
-    def test_app_config_invalid_environment(self):
+    def test_app_config_invalid_environment(self, monkeypatch):
         """Test AppConfig with invalid environment variable."""
+        monkeypatch.setenv("ENVIRONMENT", "invalid_env")
         # Should handle invalid environment gracefully
         config = AppConfig.from_dict({})
         # Environment should default or handle the invalid value
@@ -162,148 +177,218 @@ class TestConfigLoader:
         
         assert loader.config_file == Path(DefaultValues.DEFAULT_CONFIG_FILE)
     
-    def test_load_existing_file_success(self):
+    def test_load_existing_file_success(self, tmp_path):
         """Test loading existing valid config file."""
         config_data = {
             "model_mappings": {"gpt-4": "gpt-4-0613"},
             "security": {"enable_auth": True}
         }
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(config_data))
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f)
-            temp_path = f.name
+        loader = ConfigLoader(str(config_path))
+        config = loader.load()
         
-        try:
-            loader = ConfigLoader(temp_path)
-            config = loader.load()
-            
-            assert isinstance(config, AppConfig)
-            assert config.model_mappings["gpt-4"] == "gpt-4-0613"
-            assert config.security.enable_auth is True
-        finally:
-            os.unlink(temp_path)
+        assert isinstance(config, AppConfig)
+        assert config.model_mappings["gpt-4"] == "gpt-4-0613"
+        assert config.security.enable_auth is True
+    
+    def test_repeated_load_returns_independent_config(self, tmp_path):
+        """Test each load builds a fresh config that callers can modify safely."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({
+            "model_mappings": {"gpt-4": "gpt-4-0613"},
+            "security": {"trusted_hosts": ["example.com"]}
+        }))
+        loader = ConfigLoader(str(config_path))
+        
+        first = loader.load()
+        first.model_mappings["gpt-4"] = "changed"
+        first.security.trusted_hosts.append("evil.com")
+        second = loader.load()
+        
+        assert second is not first
+        assert second.model_mappings["gpt-4"] == "gpt-4-0613"
+        assert second.security.trusted_hosts == ["example.com"]
     
-    def test_load_nonexistent_file_creates_default(self):
+    def test_repeated_load_reads_current_environment(self, tmp_path, monkeypatch):
+        """Test a later load picks up environment changes."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"model_mappings": {"gpt-4": "gpt-4-0613"}}))
+        loader = ConfigLoader(str(config_path))
+        monkeypatch.setenv("API_KEY", "first-key")
+        loader.load()
+        
+        monkeypatch.setenv("API_KEY", "second-key")
+        config = loader.load()
+        
+        assert config.api_key == "second-key"
+    
+    def test_load_changed_file_is_reparsed(self, tmp_path):
+        """Test a later load picks up changes to the file."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"model_mappings": {"gpt-4": "gpt-4-0613"}}))
+        loader = ConfigLoader(str(config_path))
+        loader.load()
+        
+        config_path.write_text(json.dumps({"model_mappings": {"gpt-4": "gpt-4-turbo-2024"}}))
+        config = loader.load()
+        
+        assert config.model_mappings["gpt-4"] == "gpt-4-turbo-2024"
+    
+    def test_load_nonexistent_file_creates_default(self, tmp_path):
         """Test loading non-existent file creates default config."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = os.path.join(temp_dir, "nonexistent_config.json")
-            loader = ConfigLoader(config_path)
-            
-            config = loader.load()
-            
-            assert isinstance(config, AppConfig)
-            assert Path(config_path).exists()  # Should have created the file
+        config_path = tmp_path / "nonexistent_config.json"
+        loader = ConfigLoader(str(config_path))
+        
+        config = loader.load()
+        
+        assert isinstance(config, AppConfig)
+        assert config_path.exists()  # Should have created the file
     
-    def test_load_invalid_json_fallback(self):
+    def test_load_invalid_json_fallback(self, tmp_path):
         """Test loading invalid JSON falls back to default."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write("{ invalid json }")
-            temp_path = f.name
+        config_path = tmp_path / "config.json"
+        config_path.write_text("{ invalid json }")
         
-        try:
-            loader = ConfigLoader(temp_path)
-            config = loader.load()
-            
-            assert isinstance(config, AppConfig)
-            # Should have default values
-            assert config.environment == Environment.DEVELOPMENT
-        finally:
-            os.unlink(temp_path)
+        loader = ConfigLoader(str(config_path))
+        config = loader.load()
+        
+        assert isinstance(config, AppConfig)
+        # Should have default values
+        assert config.environment == Environment.DEVELOPMENT
     
-    def test_load_file_read_error_fallback(self):
+    def test_load_file_read_error_fallback(self, tmp_path):
         """Test file read error falls back to default."""
         # Create a file that will cause read error
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            temp_path = f.name
+        config_path = tmp_path / "config.json"
+        config_path.write_text("{}")
         
         # Make file unreadable
-        os.chmod(temp_path, 0o000)
+        config_path.chmod(0o000)
         
         try:
-            loader = ConfigLoader(temp_path)
+            loader = ConfigLoader(str(config_path))
             config = loader.load()
             
             assert isinstance(config, AppConfig)
         finally:
-            os.chmod(temp_path, 0o644)  # Restore permissions
-            os.unlink(temp_path)
+            config_path.chmod(0o644)  # Restore permissions so tmp_path can be cleaned up
     
-    def test_load_json_decode_error(self):
+    def test_load_json_decode_error(self, tmp_path):
         """Test JSON decode error handling."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write('{"key": invalid}')  # Invalid JSON
-            temp_path = f.name
+        config_path = tmp_path / "config.json"
+        config_path.write_text('{"key": invalid}')  # Invalid JSON
+        loader = ConfigLoader(str(config_path))
         
-        try:
-            loader = ConfigLoader(temp_path)
+        with patch('src.config.settings.logger') as mock_logger:
+            config = loader.load()
             
-            with patch('src.config.settings.logger') as mock_logger:
-                config = loader.load()
-                
-                assert isinstance(config, AppConfig)
-                mock_logger.warning.assert_called()
-        finally:
-            os.unlink(temp_path)
+            assert isinstance(config, AppConfig)
+            mock_logger.warning.assert_called()
     
-    def test_save_config_success(self):
+    def test_save_config_success(self, tmp_path):
         """Test successful config saving."""
         config = AppConfig()
+        config_path = tmp_path / "config.json"
+        
+        loader = ConfigLoader(str(config_path))
+        loader.save(config)
+        
+        # Verify file was created and contains valid JSON
+        saved_data = json.loads(config_path.read_text())
+        
+        assert "model_mappings" in saved_data
+        assert "security" in saved_data
+    
+    def test_save_leaves_no_temp_file(self, tmp_path):
+        """Test saving replaces the target without leaving the temp file behind."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text("{}")
+        loader = ConfigLoader(str(config_path))
+        loader.save(AppConfig(model_mappings={"gpt-4": "gpt-4-0613"}))
+        
+        assert json.loads(config_path.read_text())["model_mappings"] == {"gpt-4": "gpt-4-0613"}
+        assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+    
+    @pytest.mark.skipif(os.name != "posix", reason="needs POSIX symlinks and modes")
+    def test_save_keeps_symlink_and_mode(self, tmp_path):
+        """Test saving through a symlink replaces its target and keeps the file mode."""
+        target = tmp_path / "real.json"
+        target.write_text("{}")
+        target.chmod(0o640)
+        link = tmp_path / "config.json"
+        link.symlink_to(target)
+        
+        ConfigLoader(str(link)).save(AppConfig(model_mappings={"gpt-4": "gpt-4-0613"}))
+        
+        assert link.is_symlink()
+        assert json.loads(target.read_text())["model_mappings"] == {"gpt-4": "gpt-4-0613"}
+        assert stat.S_IMODE(target.stat().st_mode) == 0o640
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["config.json", "real.json"]
+    
+    def test_save_falls_back_to_in_place_write(self, tmp_path):
+        """Test saving writes in place when the file cannot be renamed over, e.g. a bind mount."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text("{}")
+        loader = ConfigLoader(str(config_path))
+        
+        with patch('src.config.settings.os.replace', side_effect=OSError(errno.EBUSY, "Device or resource busy")):
+            loader.save(AppConfig(model_mappings={"gpt-4": "gpt-4-0613"}))
+        
+        assert json.loads(config_path.read_text())["model_mappings"] == {"gpt-4": "gpt-4-0613"}
+        assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+    
+    def test_save_does_not_write_in_place_on_other_errors(self, tmp_path):
+        """Test failures such as a full disk leave the existing config untouched."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text("{}")
+        loader = ConfigLoader(str(config_path))
+        
+        with patch('src.config.settings.os.replace', side_effect=OSError(errno.ENOSPC, "No space left")):
+            with pytest.raises(ConfigurationError):
+                loader.save(AppConfig(model_mappings={"gpt-4": "gpt-4-0613"}))
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_path = f.name
-        
-        try:
-            loader = ConfigLoader(temp_path)
-            loader.save(config)
-            
-            # Verify file was created and contains valid JSON
-            with open(temp_path, 'r') as f:
-                saved_data = json.load(f)
-            
-            assert "model_mappings" in saved_data
-            assert "security" in saved_data
-        finally:
-            os.unlink(temp_path)
+        assert config_path.read_text() == "{}"
+        assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
     
-    def test_save_config_error(self):
+    def test_save_config_error(self, tmp_path):
         """Test config save error handling."""
         config = AppConfig()
         
         # Try to save to an invalid path
-        invalid_path = "/root/invalid/path/config.json"
-        loader = ConfigLoader(invalid_path)
+        invalid_path = tmp_path / "invalid" / "path" / "config.json"
+        loader = ConfigLoader(str(invalid_path))
         
         with pytest.raises(ConfigurationError):
             loader.save(config)
     
-    def test_create_default_config_directory_creation(self):
+    def test_create_default_config_directory_creation(self, tmp_path):
         """Test default config creation with directory creation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = os.path.join(temp_dir, "subdir", "config.json")
-            loader = ConfigLoader(config_path)
-            
-            # Directory doesn't exist yet
-            assert not os.path.exists(os.path.dirname(config_path))
-            
-            config = loader._create_default_config()
-            
-            assert isinstance(config, AppConfig)
-            # Note: Directory might not be created until save() is called
+        config_path = tmp_path / "subdir" / "config.json"
+        loader = ConfigLoader(str(config_path))
+        
+        # Directory doesn't exist yet
+        assert not config_path.parent.exists()
+        
+        config = loader._create_default_config()
+        
+        assert isinstance(config, AppConfig)
+        # Note: Directory might not be created until save() is called
     
-    def test_create_default_config_write_error(self):
+    def test_create_default_config_write_error(self, tmp_path):
         """Test default config creation with write error."""
         # Create a directory where file should be (will cause write error)
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = os.path.join(temp_dir, "is_directory")
-            os.makedirs(config_path)  # Create directory with same name as file
-            
-            loader = ConfigLoader(config_path)
+        config_path = tmp_path / "is_directory"
+        config_path.mkdir()  # Create directory with same name as file
+        
+        loader = ConfigLoader(str(config_path))
+        
+        with patch('src.config.settings.logger') as mock_logger:
+            config = loader._create_default_config()
             
-            with patch('src.config.settings.logger') as mock_logger:
-                config = loader._create_default_config()
-                
-                assert isinstance(config, AppConfig)
-                mock_logger.warning.assert_called()
+            assert isinstance(config, AppConfig)
+            mock_logger.warning.assert_called()
 
 
 class TestConfigurationError:
@@ -326,17 +411,12 @@ class TestConfigurationEdgeCases:
     
     def test_empty_config_file(self):
         """Test handling of empty config file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            # Write empty file
-            temp_path = f.name
+        written = []
+        loader = ConfigLoader(source=lambda: b"", sink=written.append)
+        config = loader.load()
         
-        try:
-            loader = ConfigLoader(temp_path)
-            config = loader.load()
-            
-            assert isinstance(config, AppConfig)
-        finally:
-            os.unlink(temp_path)
+        assert isinstance(config, AppConfig)
+        assert len(written) == 1  # Default config written back
     
     def test_config_with_null_values(self):
         """Test config with null/None values."""
@@ -345,18 +425,21 @@ class TestConfigurationEdgeCases:
             "security": None
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f)
-            temp_path = f.name
+        loader = ConfigLoader(source=lambda: json.dumps(config_data).encode())
+        config = loader.load()
         
-        try:
-            loader = ConfigLoader(temp_path)
-            config = loader.load()
-            
-            assert isinstance(config, AppConfig)
-            # Should handle None values gracefully
-        finally:
-            os.unlink(temp_path)
+        assert isinstance(config, AppConfig)
+        # Null sections fall back to the defaults
+        assert config.model_mappings == ModelMappings.DEFAULT_MAPPINGS
+        assert config.security.enable_auth is False
+    
+    def test_config_with_null_trusted_hosts(self):
+        """Test a null trusted_hosts passes through for TrustedHostMiddleware to default."""
+        loader = ConfigLoader(source=lambda: b'{"security": {"trusted_hosts": null}}')
+        
+        config = loader.load()
+        
+        assert config.security.trusted_hosts is None
     
     def test_config_with_extra_fields(self):
         """Test config with extra unknown fields."""
@@ -366,78 +449,152 @@ class TestConfigurationEdgeCases:
             "another_unknown": {"nested": "value"}
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f)
-            temp_path = f.name
+        loader = ConfigLoader(source=lambda: json.dumps(config_data).encode())
+        config = loader.load()
         
-        try:
-            loader = ConfigLoader(temp_path)
+        assert isinstance(config, AppConfig)
+        assert config.model_mappings["gpt-4"] == "gpt-4-0613"
+        # Extra fields should be ignored
+    
+    @pytest.mark.parametrize("payload,message", [
+        (b'["not", "an", "object"]', "Config must be a JSON object, got list"),
+        (b'{"security": "enabled"}', "'security' must be a JSON object, got str"),
+    ])
+    def test_config_with_invalid_structure(self, payload, message):
+        """Test structurally invalid configs raise a descriptive error."""
+        loader = ConfigLoader(source=lambda: payload)
+        
+        with pytest.raises(ConfigurationError) as exc:
+            loader.load()
+        assert message in str(exc.value)
+    
+    def test_config_with_non_string_mapping_target(self):
+        """Test mapping targets are not type-checked; the service skips falsy ones."""
+        loader = ConfigLoader(source=lambda: b'{"model_mappings": {"foo": null, "gpt-4": "gpt-4-0613"}}')
+        
+        config = loader.load()
+        
+        assert config.model_mappings == {"foo": None, "gpt-4": "gpt-4-0613"}
+    
+    @pytest.mark.parametrize("payload", [b"", b"   ", b"<config/>", b"key = value"])
+    def test_non_json_document_skips_parser(self, payload):
+        """Test payloads that cannot start a JSON value fall back without being parsed."""
+        loader = ConfigLoader(source=lambda: payload, sink=lambda data: None)
+        
+        with patch('src.config.settings._json_loads') as mock_json_loads:
             config = loader.load()
-            
-            assert isinstance(config, AppConfig)
-            assert config.model_mappings["gpt-4"] == "gpt-4-0613"
-            # Extra fields should be ignored
-        finally:
-            os.unlink(temp_path)
+        
+        assert isinstance(config, AppConfig)
+        mock_json_loads.assert_not_called()
+    
+    @pytest.mark.parametrize("payload", ["42", '"x"', "null", "true"])
+    def test_scalar_config_file_raises_and_is_kept(self, tmp_path, payload):
+        """Test a valid but non-object JSON file raises without being overwritten."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(payload)
+        
+        with pytest.raises(ConfigurationError):
+            ConfigLoader(str(config_path)).load()
+        assert config_path.read_text() == payload
+    
+    def test_empty_object_skips_parser(self, monkeypatch):
+        """Test an empty-object config is built from defaults without parsing."""
+        monkeypatch.setenv("PORT", "3000")
+        loader = ConfigLoader(source=lambda: b"{}\n")
+        
+        with patch('src.config.settings._json_loads') as mock_json_loads:
+            config = loader.load()
+        
+        mock_json_loads.assert_not_called()
+        assert config.model_mappings == ModelMappings.DEFAULT_MAPPINGS
+        assert config.port == 3000
     
-    @patch('src.config.settings.json.load')
-    def test_load_general_exception(self, mock_json_load):
+    def test_source_is_read_on_every_load(self):
+        """Test callable sources bypass the file cache."""
+        payloads = iter([b'{"model_mappings": {"a": "b"}}', b'{"model_mappings": {"a": "c"}}'])
+        loader = ConfigLoader(source=lambda: next(payloads))
+        
+        assert loader.load().model_mappings == {"a": "b"}
+        assert loader.load().model_mappings == {"a": "c"}
+    
+    def test_save_to_sink(self):
+        """Test saving writes serialized JSON to the sink."""
+        written = []
+        loader = ConfigLoader(sink=written.append)
+        loader.save(AppConfig(model_mappings={"gpt-4": "gpt-4-0613"}))
+        
+        assert json.loads(written[0])["model_mappings"] == {"gpt-4": "gpt-4-0613"}
+    
+    def test_source_without_sink_never_writes_file(self, tmp_path):
+        """Test a read-only source falls back to defaults without creating config_file."""
+        config_path = tmp_path / "config.json"
+        loader = ConfigLoader(str(config_path), source=lambda: b"not json")
+        
+        assert isinstance(loader.load(), AppConfig)
+        with pytest.raises(ConfigurationError):
+            loader.save(AppConfig())
+        assert not config_path.exists()
+    
+    @patch('src.config.settings._json_loads')
+    def test_load_general_exception(self, mock_json_loads, tmp_path):
         """Test general exception handling in load."""
-        mock_json_load.side_effect = Exception("Unexpected error")
+        mock_json_loads.side_effect = Exception("Unexpected error")
+        config_path = tmp_path / "config.json"
+        config_path.write_text('{"model_mappings": {}}')
+        loader = ConfigLoader(str(config_path))
         
-        with tempfile.NamedTemporaryFile(suffix='.json') as f:
-            loader = ConfigLoader(f.name)
-            
-            with pytest.raises(ConfigurationError):
-                loader.load()
+        with pytest.raises(ConfigurationError):
+            loader.load()
     
-    @patch('src.config.settings.json.dump')
-    def test_save_json_error(self, mock_json_dump):
+    @patch('src.config.settings._json_dumps')
+    def test_save_json_error(self, mock_json_dumps, tmp_path):
         """Test JSON serialization error in save."""
-        mock_json_dump.side_effect = TypeError("Not serializable")
+        mock_json_dumps.side_effect = TypeError("Not serializable")
         
         config = AppConfig()
+        loader = ConfigLoader(str(tmp_path / "config.json"))
         
-        with tempfile.NamedTemporaryFile(suffix='.json') as f:
-            loader = ConfigLoader(f.name)
-            
-            with pytest.raises(ConfigurationError):
-                loader.save(config)
+        with pytest.raises(ConfigurationError):
+            loader.save(config)
 
 
 class TestEnvironmentVariableHandling:
     """Test environment variable handling in configuration."""
     
-    @patch.dict(os.environ, {})
     def test_missing_environment_variables(self):
         """Test handling of missing environment variables."""
-        config = AppConfig.from_dict({})
+        config = AppConfig.from_dict({}, env={})
         
         assert config.environment == Environment.DEVELOPMENT  # Default
         assert config.port == DefaultValues.DEFAULT_PORT  # Default
         assert config.api_key is None
         assert config.webhook_secret is None
     
-    @patch.dict(os.environ, {
-        "ENVIRONMENT": "production",
-        "PORT": "3000",
-        "API_KEY": "secret-key",
-        "WEBHOOK_SECRET": "webhook-secret"
-    })
     def test_all_environment_variables_set(self):
         """Test with all environment variables set."""
-        config = AppConfig.from_dict({})
+        config = AppConfig.from_dict({}, env={
+            "ENVIRONMENT": "production",
+            "PORT": "3000",
+            "API_KEY": "secret-key",
+            "WEBHOOK_SECRET": "webhook-secret"
+        })
         
         assert config.environment == Environment.PRODUCTION
         assert config.port == 3000
         assert config.api_key == "secret-key"
         assert config.webhook_secret == "webhook-secret"
     
-    @patch.dict(os.environ, {"PORT": "not_a_number"})
+    def test_defaults_to_process_environment(self, monkeypatch):
+        """Test from_dict reads os.environ when no env mapping is given."""
+        monkeypatch.setenv("PORT", "3000")
+        config = AppConfig.from_dict({})
+        
+        assert config.port == 3000
+    
     def test_invalid_port_environment_variable(self):
         """Test handling of invalid PORT environment variable."""
         # Should handle gracefully now, not raise ValueError
-        config = AppConfig.from_dict({})
+        config = AppConfig.from_dict({}, env={"PORT": "not_a_number"})
         # Should use default port when invalid
         from src.config.constants import DefaultValues
         assert config.port == DefaultValues.DEFAULT_PORT
@@ -454,6 +611,13 @@ class TestModelMappingsHandling:
         assert len(config.model_mappings) > 0
         # Should be a copy, not the original
         assert config.model_mappings is not ModelMappings.DEFAULT_MAPPINGS
+        config.model_mappings["custom-model"] = "custom-target"
+        assert "custom-model" not in ModelMappings.DEFAULT_MAPPINGS
+    
+    def test_default_model_mappings_read_only(self):
+        """Test the shared default mappings cannot be mutated."""
+        with pytest.raises(TypeError):
+            ModelMappings.DEFAULT_MAPPINGS["custom-model"] = "custom-target"
     
     def test_custom_model_mappings_override(self):
         """Test custom model mappings override defaults."""
@@ -464,6 +628,14 @@ class TestModelMappingsHandling:
         
         assert config.model_mappings == custom_mappings
     
+    def test_custom_model_mappings_interned(self):
+        """Test model names loaded from config are interned."""
+        config = AppConfig.from_dict(json.loads('{"model_mappings": {"custom-model": "custom-target"}}'))
+        
+        key, value = next(iter(config.model_mappings.items()))
+        assert key is sys.intern("custom-model")
+        assert value is sys.intern("custom-target")
+    
     def test_empty_model_mappings(self):
         """Test handling of empty model mappings."""
         config_dict = {"model_mappings": {}}
@@ -476,24 +648,22 @@ class TestModelMappingsHandling:
 class TestConfigIntegration:
     """Integration tests for configuration system."""
     
-    def test_full_config_lifecycle(self):
+    def test_full_config_lifecycle(self, tmp_path):
         """Test complete config lifecycle: create, save, load, modify."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = os.path.join(temp_dir, "test_config.json")
-            loader = ConfigLoader(config_path)
-            
-            # 1. Create default config
-            config1 = loader.load()
-            assert isinstance(config1, AppConfig)
-            
-            # 2. Modify config
-            config1.security.enable_auth = True
-            config1.model_mappings["test"] = "test-model"
-            
-            # 3. Save config
-            loader.save(config1)
-            
-            # 4. Load again and verify changes persisted
-            config2 = loader.load()
-            assert config2.security.enable_auth is True
-            assert config2.model_mappings["test"] == "test-model"
\ No newline at end of file
+        loader = ConfigLoader(str(tmp_path / "test_config.json"))
+        
+        # 1. Create default config
+        config1 = loader.load()
+        assert isinstance(config1, AppConfig)
+        
+        # 2. Modify config
+        config1.security.enable_auth = True
+        config1.model_mappings["test"] = "test-model"
+        
+        # 3. Save config
+        loader.save(config1)
+        
+        # 4. Load again and verify changes persisted
+        config2 = loader.load()
+        assert config2.security.enable_auth is True
+        assert config2.model_mappings["test"] == "test-model"
\ No newline at end of file
@@ -1,157 +1,147 @@
 """Tests for domain services."""
 
 import pytest
-import time
+from dataclasses import dataclass
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
+from src.domain import services as _services_module
 from src.domain.services import (
     ImpactCalculationService, CalculationIdService, HealthService,
     ModelInfoService, TestService, EcologitsRepository
 )
 from src.domain.models import CalculationResult, HealthStatus, ModelInfo, TestResult
 # ModelMatch removed - model discovery service was eliminated
-from src.config.settings import AppConfig
 from src.config.constants import ErrorMessages
 
 
+@dataclass(slots=True)
+class StubConfig:
+    """Stand-in for AppConfig; the services only read model_mappings."""
+    model_mappings: dict
+
+
+def _stub_config(mappings):
+    """Build a fresh stub config with its own copy of the mappings."""
+    return StubConfig(model_mappings=dict(mappings))
+
+
+# Impacts returned by every MockEcologitsRepo; the services only read them
+_IMPACTS = SimpleNamespace(
+    energy=SimpleNamespace(value=SimpleNamespace(mean=0.001234)),
+    gwp=SimpleNamespace(value=SimpleNamespace(mean=0.000567))
+)
+
+# Result handed back by mock calculation services; TestService only reads it
+_CANNED_SUCCESS = CalculationResult.success_result(
+    energy_kwh=0.001234,
+    gwp_kgco2eq=0.000567,
+    normalized_model="gpt-4o"
+)
+
+
 class MockEcologitsRepo:
     """Mock EcoLogits repository for testing."""
     
-    def __init__(self, supported_models=None, should_fail=False):
+    def __init__(self, supported_models=None):
         self.supported_models = supported_models or ["gpt-4o", "claude-3-opus"]
-        self.should_fail = should_fail
+        # Callers only count or pass these along, so build them once
+        self._models = {name: SimpleNamespace(name=name) for name in self.supported_models}
+        self._available_models = dict.fromkeys(self.supported_models)
     
     def get_model(self, model_name):
-        if self.should_fail:
-            raise Exception("Model retrieval failed")
-        if model_name in self.supported_models:
-            return Mock(name=f"model_{model_name}")
+        model = self._models.get(model_name)
+        if model is not None:
+            return model
         raise Exception(f"Model {model_name} not found")
     
     def calculate_impacts(self, model, input_tokens, output_tokens):
-        if self.should_fail:
-            raise Exception("Impact calculation failed")
-        
-        mock_impacts = Mock()
-        mock_impacts.energy.value.mean = 0.001234
-        mock_impacts.gwp.value.mean = 0.000567
-        return mock_impacts
+        return _IMPACTS
     
     def get_available_models(self):
-        if self.should_fail:
-            raise Exception("Failed to get models")
-        return {name: Mock() for name in self.supported_models}
+        return self._available_models
     
     def is_model_supported(self, model_name):
         return model_name in self.supported_models
 
 
+class FailingMockEcologitsRepo(MockEcologitsRepo):
+    """Mock EcoLogits repository whose lookups and calculations always raise."""
+    
+    def get_model(self, model_name):
+        raise Exception("Model retrieval failed")
+    
+    def calculate_impacts(self, model, input_tokens, output_tokens):
+        raise Exception("Impact calculation failed")
+    
+    def get_available_models(self):
+        raise Exception("Failed to get models")
+
+
 class TestImpactCalculationService:
     """Test ImpactCalculationService."""
     
     @pytest.fixture
     def mock_config(self):
         """Create mock configuration."""
-        config = Mock(spec=AppConfig)
-        config.model_mappings = {
+        return _stub_config({
             "gpt-4o": "gpt-4o-2024-05-13",
             "claude": "claude-3-opus"
-        }
-        return config
+        })
     
     # Model discovery removed - replaced with simple normalization
     
-    def test_calculate_impact_success_with_normalization(self, mock_config):
-        """Test successful impact calculation with model name normalization."""
-        repo = MockEcologitsRepo(supported_models=["gpt-4o-2024-05-13"])
+    @pytest.mark.parametrize("model,supported_models,normalized", [
+        # typo corrected by normalization
+        ("gpt4o", ["gpt-4o-2024-05-13"], "gpt-4o-2024-05-13"),
+        # fallback to config mappings
+        ("claude", ["claude-3-opus"], "claude-3-opus"),
+    ], ids=["normalization", "config_fallback"])
+    def test_calculate_impact_success(self, mock_config, model, supported_models, normalized):
+        """Test successful impact calculation after model name normalization."""
+        repo = MockEcologitsRepo(supported_models=supported_models)
         service = ImpactCalculationService(repo, mock_config)
         
-        result = service.calculate_impact("gpt4o", 1000, 500)
+        result = service.calculate_impact(model, 1000, 500)
         
         assert result.success is True
         assert result.energy_kwh == 0.001234
         assert result.gwp_kgco2eq == 0.000567
-        assert result.normalized_model == "gpt-4o-2024-05-13"
-    
-    def test_calculate_impact_success_fallback_to_config(self, mock_config):
-        """Test successful impact calculation fallback to config mappings."""
-        repo = MockEcologitsRepo(supported_models=["claude-3-opus"])
+        assert result.normalized_model == normalized
+    
+    @pytest.mark.parametrize("model,input_tokens,repo_class,supported_models,expected_error", [
+        ("gpt-4o", -100, MockEcologitsRepo, ["gpt-4o"], ErrorMessages.TOKEN_COUNTS_NEGATIVE),
+        # no normalization match, so the name reaches the repository unchanged
+        ("unknown-model", 1000, MockEcologitsRepo, ["gpt-4o"],
+         ErrorMessages.MODEL_NOT_SUPPORTED.format(model="unknown-model")),
+        # the mapped target is supported, so the failing repository raises on get_model
+        ("gpt-4o", 1000, FailingMockEcologitsRepo, ["gpt-4o-2024-05-13"],
+         "Calculation failed for gpt-4o-2024-05-13"),
+    ], ids=["negative_tokens", "unsupported_model", "repo_exception"])
+    def test_calculate_impact_failure(self, mock_config, model, input_tokens, repo_class,
+                                      supported_models, expected_error):
+        """Test impact calculation failures return an error result with zero impacts."""
+        repo = repo_class(supported_models=supported_models)
         service = ImpactCalculationService(repo, mock_config)
         
-        result = service.calculate_impact("claude", 1000, 500)
-        
-        assert result.success is True
-        assert result.energy_kwh == 0.001234
-        assert result.normalized_model == "claude-3-opus"
-    
-    def test_calculate_impact_negative_tokens(self, mock_config):
-        """Test impact calculation with negative token counts."""
-        repo = MockEcologitsRepo()
-        service = ImpactCalculationService(repo, mock_config)
-        
-        result = service.calculate_impact("gpt-4o", -100, 500)
+        result = service.calculate_impact(model, input_tokens, 500)
         
         assert result.success is False
-        assert result.error == ErrorMessages.TOKEN_COUNTS_NEGATIVE
+        assert result.error.startswith(expected_error)
         assert result.energy_kwh == 0
         assert result.gwp_kgco2eq == 0
     
-    def test_calculate_impact_unsupported_model(self, mock_config):
-        """Test impact calculation with unsupported model."""
-        repo = MockEcologitsRepo(supported_models=["gpt-4o"])
-        service = ImpactCalculationService(repo, mock_config)
-        
-        result = service.calculate_impact("unknown-model", 1000, 500)
-        
-        assert result.success is False
-        assert "not supported" in result.error
-        assert result.energy_kwh == 0
-    
-    def test_calculate_impact_unknown_model(self, mock_config):
-        """Test impact calculation with unknown model (no normalization match)."""
-        repo = MockEcologitsRepo(supported_models=["gpt-4o"])
-        service = ImpactCalculationService(repo, mock_config)
-        
-        result = service.calculate_impact("unknown-model", 1000, 500)
-        
-        assert result.success is False
-        assert "not supported" in result.error
-    
-    def test_calculate_impact_repo_exception(self, mock_config):
-        """Test impact calculation when repository throws exception."""
-        repo = MockEcologitsRepo(supported_models=["gpt-4o"], should_fail=True)
-        service = ImpactCalculationService(repo, mock_config)
-        
-        result = service.calculate_impact("gpt-4o", 1000, 500)
-        
-        assert result.success is False
-        assert ("not found" in result.error or "not supported" in result.error)
-    
-    def test_normalize_model_with_typo_correction(self, mock_config):
-        """Test model normalization with typo correction."""
-        repo = MockEcologitsRepo()
-        service = ImpactCalculationService(repo, mock_config)
-        
-        normalized = service._normalize_model("gpt4o")
-        
-        assert normalized == "gpt-4o-2024-05-13"  # Uses config mapping
-    
-    def test_normalize_model_fallback_to_config(self, mock_config):
-        """Test model normalization fallback to config mappings."""
-        repo = MockEcologitsRepo()
-        service = ImpactCalculationService(repo, mock_config)
-        
-        normalized = service._normalize_model("claude")
-        
-        assert normalized == "claude-3-opus"
-    
-    def test_normalize_model_no_mapping(self, mock_config):
-        """Test model normalization with no mapping found."""
-        repo = MockEcologitsRepo()
-        service = ImpactCalculationService(repo, mock_config)
-        
-        normalized = service._normalize_model("unknown-model")
-        
-        assert normalized == "unknown-model"  # Returns original
+    @pytest.mark.parametrize("model,normalized", [
+        # typo corrected through the config mapping
+        ("gpt4o", "gpt-4o-2024-05-13"),
+        ("claude", "claude-3-opus"),
+        # no mapping found, the original name is returned
+        ("unknown-model", "unknown-model"),
+    ], ids=["typo_correction", "config_fallback", "no_mapping"])
+    def test_normalize_model(self, mock_config, model, normalized):
+        """Test model name normalization."""
+        service = ImpactCalculationService(MockEcologitsRepo(), mock_config)
+        
+        assert service._normalize_model(model) == normalized
 
 
 class TestCalculationIdService:
@@ -164,23 +154,25 @@ class TestCalculationIdService:
         assert calc_id.startswith("calc-")
         assert len(calc_id) == 21  # "calc-" + 16 chars
     
-    def test_generate_id_uniqueness(self):
-        """Test that generated IDs are unique."""
+    def test_generate_id_changes_with_clock(self, monkeypatch):
+        """Test that the clock reading feeds into the ID, so identical requests differ over time."""
+        monkeypatch.setattr('time.time_ns', iter([1_000_000_000, 1_100_000_000]).__next__)
         id1 = CalculationIdService.generate_id("gpt-4o", 1000, 500)
-        time.sleep(0.001)  # Ensure time difference
         id2 = CalculationIdService.generate_id("gpt-4o", 1000, 500)
         
         assert id1 != id2
     
-    def test_generate_id_deterministic_components(self):
+    def test_generate_id_deterministic_components(self, monkeypatch):
         """Test that ID generation includes model and token data."""
-        # Mock time to make this deterministic
-        with patch('time.time', return_value=1234567890.0):
-            calc_id = CalculationIdService.generate_id("test-model", 100, 200)
-            
-            # Should be deterministic with fixed time - check format
-            assert calc_id.startswith("calc-")
-            assert len(calc_id) == 21
+        # Freeze time to make this deterministic
+        monkeypatch.setattr('time.time_ns', lambda: 1234567890000000000)
+        calc_id = CalculationIdService.generate_id("test-model", 100, 200)
+        
+        # Should be deterministic with fixed time - check format
+        assert calc_id.startswith("calc-")
+        assert len(calc_id) == 21
+        assert CalculationIdService.generate_id("test-model", 100, 200) == calc_id
+        assert CalculationIdService.generate_id("test-model", 100, 201) != calc_id
     
     def test_generate_id_static_method(self):
         """Test that generate_id is a static method."""
@@ -221,12 +213,10 @@ class TestModelInfoService:
     @pytest.fixture
     def mock_config(self):
         """Create mock configuration."""
-        config = Mock(spec=AppConfig)
-        config.model_mappings = {
+        return _stub_config({
             "gpt-4o": "gpt-4o-2024-05-13",
             "claude-3": "claude-3-opus"
-        }
-        return config
+        })
     
     def test_get_model_info_success(self, mock_config):
         """Test successful model info retrieval."""
@@ -243,7 +233,7 @@ class TestModelInfoService:
     
     def test_get_model_info_repo_failure(self, mock_config):
         """Test model info when repository fails."""
-        repo = MockEcologitsRepo(should_fail=True)
+        repo = FailingMockEcologitsRepo()
         service = ModelInfoService(repo, mock_config)
         
         # Should handle repo failure gracefully
@@ -260,11 +250,7 @@ class TestTestService:
     def mock_calculation_service(self):
         """Create mock calculation service."""
         service = Mock()
-        service.calculate_impact.return_value = CalculationResult.success_result(
-            energy_kwh=0.001234,
-            gwp_kgco2eq=0.000567,
-            normalized_model="gpt-4o"
-        )
+        service.calculate_impact.return_value = _CANNED_SUCCESS
         return service
     
     def test_run_test_calculation_success(self, mock_calculation_service):
@@ -310,12 +296,8 @@ class TestEcologitsRepositoryProtocol:
         repo = MockEcologitsRepo()
         
         # Should have all required methods
-        assert hasattr(repo, 'get_model')
-        assert hasattr(repo, 'calculate_impacts')
-        assert hasattr(repo, 'get_available_models')
-        assert callable(repo.get_model)
-        assert callable(repo.calculate_impacts)
-        assert callable(repo.get_available_models)
+        required = {'get_model', 'calculate_impacts', 'get_available_models'}
+        assert required <= {name for name in dir(repo) if callable(getattr(repo, name))}
     
     def test_protocol_method_signatures(self):
         """Test protocol method signatures."""
@@ -338,8 +320,7 @@ class TestServiceIntegration:
     def test_calculation_service_with_test_service(self):
         """Test calculation service integrated with test service."""
         repo = MockEcologitsRepo(supported_models=["gpt-4o"])
-        config = Mock(spec=AppConfig)
-        config.model_mappings = {"gpt-4o": "gpt-4o"}
+        config = _stub_config({"gpt-4o": "gpt-4o"})
         
         calc_service = ImpactCalculationService(repo, config)
         test_service = TestService(calc_service)
@@ -353,8 +334,7 @@ class TestServiceIntegration:
     def test_model_info_service_with_calculation_service(self):
         """Test model info service with calculation service."""
         repo = MockEcologitsRepo(supported_models=["gpt-4o", "claude-3-opus"])
-        config = Mock(spec=AppConfig)
-        config.model_mappings = {"gpt-4o": "gpt-4o", "claude": "claude-3-opus"}
+        config = _stub_config({"gpt-4o": "gpt-4o", "claude": "claude-3-opus"})
         
         calc_service = ImpactCalculationService(repo, config)
         info_service = ModelInfoService(repo, config)
@@ -373,9 +353,8 @@ class TestServiceErrorHandling:
     
     def test_all_services_handle_repo_failures(self):
         """Test that all services handle repository failures gracefully."""
-        failing_repo = MockEcologitsRepo(should_fail=True)
-        config = Mock(spec=AppConfig)
-        config.model_mappings = {}
+        failing_repo = FailingMockEcologitsRepo()
+        config = _stub_config({})
         
         # ImpactCalculationService
         calc_service = ImpactCalculationService(failing_repo, config)
@@ -396,13 +375,12 @@ class TestServiceErrorHandling:
 class TestServiceLogging:
     """Test logging in services."""
     
-    @patch('src.domain.services.logger')
+    @patch.object(_services_module, 'logger')
     def test_calculation_service_logs_errors(self, mock_logger):
         """Test that calculation service logs errors."""
         # Create a repo that supports the model but fails on get_model
-        repo = MockEcologitsRepo(supported_models=["test-model"], should_fail=True)
-        config = Mock(spec=AppConfig)
-        config.model_mappings = {"test-model": "test-model"}
+        repo = FailingMockEcologitsRepo(supported_models=["test-model"])
+        config = _stub_config({"test-model": "test-model"})
         
         service = ImpactCalculationService(repo, config)
         result = service.calculate_impact("test-model", 100, 50)
@@ -1,126 +1,151 @@
 """Tests for EcoLogits adapter."""
 
+import logging
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+import re
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 from src.infrastructure.ecologits_adapter import EcologitsAdapter, EcologitsServiceError
 
+_ADAPTER_LOGGER = "src.infrastructure.ecologits_adapter"
+
+_ERR_NOT_INSTALLED = re.compile("EcoLogits library is not installed")
+# The error log asserted alongside names the model
+_ERR_GET_FAILED = re.compile("Failed to get model '.*'")
+_ERR_CALC = re.compile("Failed to calculate environmental impacts")
+
+# Model and impacts stand-ins; the adapter only reads their attributes
+_MODEL = SimpleNamespace(name="gpt-4o", provider=SimpleNamespace(value="openai"))
+_IMPACTS = SimpleNamespace(
+    energy=SimpleNamespace(value=0.001234),
+    gwp=SimpleNamespace(value=0.000567)
+)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def ecologits_available(module_mocker):
+    """Report EcoLogits as installed; tests patch it back to False where needed."""
+    module_mocker.patch('src.infrastructure.ecologits_adapter.ECOLOGITS_AVAILABLE', True)
+
+
+@pytest.fixture
+def mock_models(mocker):
+    """Replace the adapter's EcoLogits model repository."""
+    return mocker.patch('src.infrastructure.ecologits_adapter.models', new_callable=Mock)
+
+
+@pytest.fixture(autouse=True)
+def mock_detect_provider(mocker):
+    """Resolve every model to the openai provider; tests override return_value or side_effect."""
+    return mocker.patch('src.domain.model_utils.detect_provider', new_callable=Mock, return_value="openai")
+
+
+@pytest.fixture
+def mock_llm_impacts(mocker):
+    """Replace the EcoLogits impact calculation; it returns _IMPACTS unless a test overrides it."""
+    return mocker.patch('ecologits.tracers.utils.llm_impacts', new_callable=Mock, return_value=_IMPACTS)
+
+
+@pytest.fixture(scope="module")
+def shared_adapter(module_mocker):
+    """Adapter built once per module against a mocked EcoLogits model repository."""
+    models = module_mocker.patch('src.infrastructure.ecologits_adapter.models', new_callable=Mock)
+    return EcologitsAdapter(), models
+
+
+@pytest.fixture
+def adapter(shared_adapter):
+    """The shared adapter, with its model repository mock reset for this test."""
+    adapter, models = shared_adapter
+    models.reset_mock(return_value=True, side_effect=True)
+    return adapter
+
+
+@pytest.fixture
+def adapter_models(adapter, shared_adapter):
+    """Model repository mock behind the adapter fixture."""
+    return shared_adapter[1]
+
 
 class TestEcologitsAdapterInitialization:
     """Test EcoLogits adapter initialization."""
     
-    @patch('src.infrastructure.ecologits_adapter.ECOLOGITS_AVAILABLE', True)
-    @patch('src.infrastructure.ecologits_adapter.models')
-    def test_init_success(self, mock_models):
+    def test_init_success(self, mock_models, caplog):
         """Test successful initialization."""
-        adapter = EcologitsAdapter()
+        with caplog.at_level(logging.INFO, logger=_ADAPTER_LOGGER):
+            adapter = EcologitsAdapter()
+        
         assert adapter._models == mock_models
+        assert "EcologitsAdapter initialized" in caplog.messages
     
-    @patch('src.infrastructure.ecologits_adapter.ECOLOGITS_AVAILABLE', False)
     def test_init_ecologits_not_available(self):
         """Test initialization when EcoLogits is not available."""
-        with pytest.raises(EcologitsServiceError, match="EcoLogits library is not installed"):
-            EcologitsAdapter()
+        with patch('src.infrastructure.ecologits_adapter.ECOLOGITS_AVAILABLE', False):
+            with pytest.raises(EcologitsServiceError, match=_ERR_NOT_INSTALLED):
+                EcologitsAdapter()
 
 
 class TestEcologitsAdapterGetModel:
     """Test get_model method."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        with patch('src.infrastructure.ecologits_adapter.ECOLOGITS_AVAILABLE', True), \
-             patch('src.infrastructure.ecologits_adapter.models') as mock_models:
-            self.mock_models = mock_models
-            self.adapter = EcologitsAdapter()
-    
-    @patch('src.domain.model_utils.detect_provider')
-    def test_get_model_success(self, mock_detect_provider):
+    def test_get_model_success(self, mock_detect_provider, adapter, adapter_models):
         """Test successful model retrieval."""
-        mock_model = Mock()
-        mock_model.name = "gpt-4o"
-        mock_model.provider.value = "openai"
-        
-        mock_detect_provider.return_value = "openai"
-        self.mock_models.find_model.return_value = mock_model
+        adapter_models.find_model.return_value = _MODEL
         
-        result = self.adapter.get_model("gpt-4o")
+        result = adapter.get_model("gpt-4o")
         
-        assert result == mock_model
+        assert result == _MODEL
         mock_detect_provider.assert_called_once_with("gpt-4o")
-        self.mock_models.find_model.assert_called_once_with("openai", "gpt-4o")
-    
-    @patch('src.domain.model_utils.detect_provider')
-    def test_get_model_not_found(self, mock_detect_provider):
-        """Test getting model that doesn't exist."""
-        mock_detect_provider.return_value = "openai"
-        self.mock_models.find_model.return_value = None
-        
-        with pytest.raises(EcologitsServiceError, match="Failed to get model 'unknown-model'"):
-            self.adapter.get_model("unknown-model")
-    
-    @patch('src.domain.model_utils.detect_provider')
-    def test_get_model_exception_handling(self, mock_detect_provider):
-        """Test exception handling in get_model."""
-        mock_detect_provider.return_value = "openai"
-        self.mock_models.find_model.side_effect = Exception("Unexpected error")
-        
-        with pytest.raises(EcologitsServiceError, match="Failed to get model 'gpt-4o'"):
-            self.adapter.get_model("gpt-4o")
+        adapter_models.find_model.assert_called_once_with("openai", "gpt-4o")
+    
+    @pytest.mark.parametrize("model_name,find_model", [
+        # the repository has no such model
+        ("unknown-model", {"return_value": None}),
+        # the repository lookup itself raises
+        ("gpt-4o", {"side_effect": Exception("Unexpected error")}),
+    ], ids=["not_found", "exception"])
+    def test_get_model_failure(self, adapter, adapter_models, model_name, find_model, caplog):
+        """Test lookup failures are logged and wrapped in EcologitsServiceError."""
+        adapter_models.find_model.configure_mock(**find_model)
+        
+        with pytest.raises(EcologitsServiceError, match=_ERR_GET_FAILED):
+            adapter.get_model(model_name)
+        
+        assert any(
+            record.levelno == logging.ERROR and record.getMessage().startswith(f"Error getting model '{model_name}': ")
+            for record in caplog.records
+        )
 
 
 class TestEcologitsAdapterCalculateImpacts:
     """Test calculate_impacts method."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        with patch('src.infrastructure.ecologits_adapter.ECOLOGITS_AVAILABLE', True), \
-             patch('src.infrastructure.ecologits_adapter.models'):
-            self.adapter = EcologitsAdapter()
-    
-    @patch('ecologits.tracers.utils.llm_impacts')
-    def test_calculate_impacts_success(self, mock_llm_impacts):
+    def test_calculate_impacts_success(self, mock_llm_impacts, adapter, caplog):
         """Test successful impact calculation."""
-        mock_model = Mock()
-        mock_model.provider.value = "openai"
-        mock_model.name = "gpt-4o"
-        
-        mock_impacts = Mock()
-        mock_impacts.energy.value = 0.001234
-        mock_impacts.gwp.value = 0.000567
-        mock_llm_impacts.return_value = mock_impacts
-        
-        result = self.adapter.calculate_impacts(mock_model, 1000, 500)
+        with caplog.at_level(logging.DEBUG, logger=_ADAPTER_LOGGER):
+            result = adapter.calculate_impacts(_MODEL, 1000, 500)
         
-        assert result == mock_impacts
+        assert result == _IMPACTS
         mock_llm_impacts.assert_called_once_with(
             provider="openai",
             model_name="gpt-4o",
             output_token_count=500,
             request_latency=1.0
         )
+        assert "Impact calculation successful: energy=0.001234, gwp=0.000567" in caplog.messages
     
-    @patch('ecologits.tracers.utils.llm_impacts')
-    def test_calculate_impacts_exception(self, mock_llm_impacts):
+    def test_calculate_impacts_exception(self, mock_llm_impacts, adapter):
         """Test exception handling in calculate_impacts."""
-        mock_model = Mock()
-        mock_model.provider.value = "openai"
-        mock_model.name = "gpt-4o"
         mock_llm_impacts.side_effect = Exception("Calculation failed")
         
-        with pytest.raises(EcologitsServiceError, match="Failed to calculate environmental impacts"):
-            self.adapter.calculate_impacts(mock_model, 1000, 500)
+        with pytest.raises(EcologitsServiceError, match=_ERR_CALC):
+            adapter.calculate_impacts(_MODEL, 1000, 500)
 
 
 class TestEcologitsAdapterGetAvailableModels:
     """Test get_available_models method."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        with patch('src.infrastructure.ecologits_adapter.ECOLOGITS_AVAILABLE', True), \
-             patch('src.infrastructure.ecologits_adapter.models') as mock_models:
-            self.mock_models = mock_models
-            self.adapter = EcologitsAdapter()
-    
-    def test_get_available_models_success(self):
+    def test_get_available_models_success(self, adapter, adapter_models):
         """Test successful model listing."""
         mock_model1 = Mock()
         mock_model1.name = "gpt-4o"
@@ -128,22 +153,22 @@ class TestEcologitsAdapterGetAvailableModels:
         mock_model2.name = "claude-3-opus"
         
         mock_model_list = [mock_model1, mock_model2]
-        self.mock_models.list_models.return_value = mock_model_list
+        adapter_models.list_models.return_value = mock_model_list
         
-        result = self.adapter.get_available_models()
+        result = adapter.get_available_models()
         
         expected = {
             "gpt-4o": mock_model1,
             "claude-3-opus": mock_model2
         }
         assert result == expected
-        self.mock_models.list_models.assert_called_once()
+        adapter_models.list_models.assert_called_once()
     
-    def test_get_available_models_exception(self):
+    def test_get_available_models_exception(self, adapter, adapter_models):
         """Test exception handling in get_available_models."""
-        self.mock_models.list_models.side_effect = Exception("API error")
+        adapter_models.list_models.side_effect = Exception("API error")
         
-        result = self.adapter.get_available_models()
+        result = adapter.get_available_models()
         
         assert result == {}
 
@@ -151,42 +176,25 @@ class TestEcologitsAdapterGetAvailableModels:
 class TestEcologitsAdapterIsModelSupported:
     """Test is_model_supported method."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        with patch('src.infrastructure.ecologits_adapter.ECOLOGITS_AVAILABLE', True), \
-             patch('src.infrastructure.ecologits_adapter.models') as mock_models:
-            self.mock_models = mock_models
-            self.adapter = EcologitsAdapter()
-    
-    @patch('src.domain.model_utils.detect_provider')
-    def test_is_model_supported_true(self, mock_detect_provider):
-        """Test model support check returns True."""
-        mock_model = Mock()
-        mock_detect_provider.return_value = "openai"
-        self.mock_models.find_model.return_value = mock_model
-        
-        result = self.adapter.is_model_supported('gpt-4o')
-        
-        assert result is True
-        mock_detect_provider.assert_called_once_with('gpt-4o')
-        self.mock_models.find_model.assert_called_once_with('openai', 'gpt-4o')
-    
-    @patch('src.domain.model_utils.detect_provider')
-    def test_is_model_supported_false(self, mock_detect_provider):
-        """Test model support check returns False."""
-        mock_detect_provider.return_value = "openai"
-        self.mock_models.find_model.return_value = None
+    @pytest.mark.parametrize("model_name,found,expected", [
+        ("gpt-4o", _MODEL, True),
+        ("unknown-model", None, False),
+    ], ids=["supported", "unsupported"])
+    def test_is_model_supported(self, mock_detect_provider, adapter, adapter_models, model_name, found, expected):
+        """Test model support follows whether find_model returns a model."""
+        adapter_models.find_model.return_value = found
         
-        result = self.adapter.is_model_supported('unknown-model')
+        result = adapter.is_model_supported(model_name)
         
-        assert result is False
+        assert result is expected
+        mock_detect_provider.assert_called_once_with(model_name)
+        adapter_models.find_model.assert_called_once_with('openai', model_name)
     
-    @patch('src.domain.model_utils.detect_provider')
-    def test_is_model_supported_exception(self, mock_detect_provider):
+    def test_is_model_supported_exception(self, mock_detect_provider, adapter):
         """Test exception handling in is_model_supported."""
         mock_detect_provider.side_effect = Exception("Provider detection failed")
         
-        result = self.adapter.is_model_supported('gpt-4o')
+        result = adapter.is_model_supported('gpt-4o')
         
         assert result is False
 
@@ -209,105 +217,18 @@ class TestEcologitsServiceError:
 class TestEcologitsAdapterIntegration:
     """Integration tests for EcoLogits adapter."""
     
-    @patch('src.domain.model_utils.detect_provider')
-    @patch('ecologits.tracers.utils.llm_impacts')
-    def test_full_workflow_success(self, mock_llm_impacts, mock_detect_provider):
+    def test_full_workflow_success(self, mock_llm_impacts, adapter, adapter_models):
         """Test full workflow from model discovery to calculation."""
-        with patch('src.infrastructure.ecologits_adapter.ECOLOGITS_AVAILABLE', True), \
-             patch('src.infrastructure.ecologits_adapter.models') as mock_models:
-            
-            # Setup mocks
-            mock_model = Mock()
-            mock_model.name = "gpt-4o"
-            mock_model.provider.value = "openai"
-            
-            mock_detect_provider.return_value = "openai"
-            mock_models.find_model.return_value = mock_model
-            
-            mock_impacts = Mock()
-            mock_impacts.energy.value = 0.001234
-            mock_impacts.gwp.value = 0.000567
-            mock_llm_impacts.return_value = mock_impacts
-            
-            # Create adapter
-            adapter = EcologitsAdapter()
-            
-            # Test model support
-            assert adapter.is_model_supported('gpt-4o') is True
-            
-            # Test model retrieval
-            model = adapter.get_model('gpt-4o')
-            assert model == mock_model
-            
-            # Test impact calculation
-            impacts = adapter.calculate_impacts(model, 1000, 500)
-            assert impacts == mock_impacts
+        adapter_models.find_model.return_value = _MODEL
+        
+        # Support check, retrieval and calculation chained on one adapter
+        assert adapter.is_model_supported('gpt-4o') is True
+        assert adapter.calculate_impacts(adapter.get_model('gpt-4o'), 1000, 500) == _IMPACTS
     
-    @patch('src.domain.model_utils.detect_provider')
-    def test_error_propagation_workflow(self, mock_detect_provider):
+    def test_error_propagation_workflow(self, adapter, adapter_models):
         """Test error propagation through workflow."""
-        with patch('src.infrastructure.ecologits_adapter.ECOLOGITS_AVAILABLE', True), \
-             patch('src.infrastructure.ecologits_adapter.models') as mock_models:
-            
-            # Setup model to fail
-            mock_detect_provider.return_value = "openai"
-            mock_models.find_model.side_effect = Exception("Connection failed")
-            
-            adapter = EcologitsAdapter()
-            
-            # Should propagate as EcologitsServiceError
-            with pytest.raises(EcologitsServiceError):
-                adapter.get_model('gpt-4o')
-
-
-class TestEcologitsAdapterLogging:
-    """Test logging in EcoLogits adapter."""
-    
-    @patch('src.infrastructure.ecologits_adapter.logger')
-    def test_initialization_logging(self, mock_logger):
-        """Test logging during initialization."""
-        with patch('src.infrastructure.ecologits_adapter.ECOLOGITS_AVAILABLE', True), \
-             patch('src.infrastructure.ecologits_adapter.models'):
-            
-            EcologitsAdapter()
-            
-            mock_logger.info.assert_called_with("EcologitsAdapter initialized")
-    
-    @patch('src.infrastructure.ecologits_adapter.logger')
-    @patch('src.domain.model_utils.detect_provider')
-    def test_error_logging_in_get_model(self, mock_detect_provider, mock_logger):
-        """Test error logging in get_model."""
-        with patch('src.infrastructure.ecologits_adapter.ECOLOGITS_AVAILABLE', True), \
-             patch('src.infrastructure.ecologits_adapter.models') as mock_models:
-            
-            mock_detect_provider.return_value = "openai"
-            mock_models.find_model.side_effect = Exception("Test error")
-            adapter = EcologitsAdapter()
-            
-            with pytest.raises(EcologitsServiceError):
-                adapter.get_model('test-model')
-            
-            mock_logger.error.assert_called_with("Error getting model 'test-model': Test error")
-    
-    @patch('src.infrastructure.ecologits_adapter.logger')
-    @patch('ecologits.tracers.utils.llm_impacts')
-    def test_debug_logging_in_calculate_impacts(self, mock_llm_impacts, mock_logger):
-        """Test debug logging in calculate_impacts."""
-        with patch('src.infrastructure.ecologits_adapter.ECOLOGITS_AVAILABLE', True), \
-             patch('src.infrastructure.ecologits_adapter.models'):
-            
-            mock_impacts = Mock()
-            mock_impacts.energy.value = 0.001234
-            mock_impacts.gwp.value = 0.000567
-            mock_llm_impacts.return_value = mock_impacts
-            
-            adapter = EcologitsAdapter()
-            mock_model = Mock()
-            mock_model.provider.value = "openai"
-            mock_model.name = "gpt-4o"
-            
-            adapter.calculate_impacts(mock_model, 1000, 500)
-            
-            mock_logger.debug.assert_called_with(
-                "Impact calculation successful: energy=0.001234, gwp=0.000567"
-            )
\ No newline at end of file
+        adapter_models.find_model.side_effect = Exception("Connection failed")
+        
+        # Should propagate as EcologitsServiceError
+        with pytest.raises(EcologitsServiceError):
+            adapter.get_model('gpt-4o')
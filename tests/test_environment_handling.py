@@ -182,14 +182,12 @@ class TestApplicationStartupEnvironmentBehavior:
         }""")
         return str(config_file)
     
-    def test_production_app_startup_configuration(self, mock_config_file_production):
+    def test_production_app_startup_configuration(self, mock_config_file_production, monkeypatch):
         """Test complete production application startup."""
-        with patch.dict('os.environ', {
-            'ENVIRONMENT': 'production',
-            'API_KEY': 'prod-api-key',
-            'WEBHOOK_SECRET': 'prod-webhook-secret'
-        }), \
-        patch('src.application.setup_logging') as mock_setup_logging, \
+        monkeypatch.setenv('ENVIRONMENT', 'production')
+        monkeypatch.setenv('API_KEY', 'prod-api-key')
+        monkeypatch.setenv('WEBHOOK_SECRET', 'prod-webhook-secret')
+        with patch('src.application.setup_logging') as mock_setup_logging, \
         patch('src.application.initialize_dependencies') as mock_init_deps, \
         patch('src.application.setup_middleware') as mock_middleware, \
         patch('src.application.setup_rate_limiting') as mock_rate_limit:
@@ -214,7 +212,7 @@ class TestApplicationStartupEnvironmentBehavior:
             assert isinstance(app, FastAPI)
             assert app.docs_url is None  # Disabled in production
     
-    def test_development_app_startup_configuration(self, tmp_path):
+    def test_development_app_startup_configuration(self, tmp_path, monkeypatch):
         """Test complete development application startup."""
         config_file = tmp_path / "dev_config.json"
         config_file.write_text("""{
@@ -224,10 +222,8 @@ class TestApplicationStartupEnvironmentBehavior:
             }
         }""")
         
-        with patch.dict('os.environ', {
-            'ENVIRONMENT': 'development'
-        }), \
-        patch('src.application.setup_logging') as mock_setup_logging, \
+        monkeypatch.setenv('ENVIRONMENT', 'development')
+        with patch('src.application.setup_logging') as mock_setup_logging, \
         patch('src.application.initialize_dependencies') as mock_init_deps, \
         patch('src.application.setup_middleware') as mock_middleware, \
         patch('src.application.setup_rate_limiting') as mock_rate_limit:
@@ -303,32 +299,30 @@ class TestEnvironmentFailureScenarios:
             fallback_call = mock_basic.call_args_list[1]
             assert fallback_call[1]['level'] == logging.INFO
     
-    def test_invalid_environment_defaults_to_development(self):
+    def test_invalid_environment_defaults_to_development(self, monkeypatch):
         """Test that invalid environment values default to development."""
-        with patch.dict('os.environ', {'ENVIRONMENT': 'invalid_env'}):
-            config = AppConfig.from_dict({})
-            
-            # Should default to development for invalid environment
-            assert config.environment == Environment.DEVELOPMENT
+        monkeypatch.setenv('ENVIRONMENT', 'invalid_env')
+        config = AppConfig.from_dict({})
+        
+        # Should default to development for invalid environment
+        assert config.environment == Environment.DEVELOPMENT
     
-    def test_missing_environment_variable_defaults_to_development(self):
+    def test_missing_environment_variable_defaults_to_development(self, monkeypatch):
         """Test that missing ENVIRONMENT variable defaults to development."""
-        with patch.dict('os.environ', {}, clear=True):
-            config = AppConfig.from_dict({})
-            
-            # Should default to development when no environment is specified
-            assert config.environment == Environment.DEVELOPMENT
+        monkeypatch.delenv('ENVIRONMENT', raising=False)
+        config = AppConfig.from_dict({})
+        
+        # Should default to development when no environment is specified
+        assert config.environment == Environment.DEVELOPMENT
     
-    def test_application_startup_handles_environment_misconfiguration(self, tmp_path):
+    def test_application_startup_handles_environment_misconfiguration(self, tmp_path, monkeypatch):
         """Test that app startup handles environment misconfiguration gracefully."""
         config_file = tmp_path / "bad_config.json"
         config_file.write_text("{}")  # Empty config
         
-        with patch.dict('os.environ', {
-            'ENVIRONMENT': 'invalid_environment',
-            'PORT': 'not_a_number'  # Invalid port
-        }), \
-        patch('src.application.setup_logging') as mock_setup_logging, \
+        monkeypatch.setenv('ENVIRONMENT', 'invalid_environment')
+        monkeypatch.setenv('PORT', 'not_a_number')  # Invalid port
+        with patch('src.application.setup_logging') as mock_setup_logging, \
         patch('src.application.initialize_dependencies') as mock_init_deps, \
         patch('src.application.setup_middleware') as mock_middleware, \
         patch('src.application.setup_rate_limiting') as mock_rate_limit:
@@ -395,18 +389,18 @@ class TestEnvironmentSpecificBehaviorIntegration:
         assert config.port == 8000
         assert config.rate_limiting.enabled is True  # Still enabled but with defaults
     
-    def test_invalid_port_environment_variable_graceful_handling(self):
+    def test_invalid_port_environment_variable_graceful_handling(self, monkeypatch):
         """Test that invalid PORT environment variable is handled gracefully."""
-        with patch.dict('os.environ', {'PORT': 'invalid_port'}):
-            config = AppConfig.from_dict({})
-            
-            # Should default to default port for invalid value
-            assert config.port == DefaultValues.DEFAULT_PORT
+        monkeypatch.setenv('PORT', 'invalid_port')
+        config = AppConfig.from_dict({})
+        
+        # Should default to default port for invalid value
+        assert config.port == DefaultValues.DEFAULT_PORT
     
-    def test_out_of_range_port_environment_variable_graceful_handling(self):
+    def test_out_of_range_port_environment_variable_graceful_handling(self, monkeypatch):
         """Test that out-of-range PORT values are handled gracefully."""
-        with patch.dict('os.environ', {'PORT': '70000'}):
-            config = AppConfig.from_dict({})
-            
-            # Should default to default port for out-of-range value
-            assert config.port == DefaultValues.DEFAULT_PORT
\ No newline at end of file
+        monkeypatch.setenv('PORT', '70000')
+        config = AppConfig.from_dict({})
+        
+        # Should default to default port for out-of-range value
+        assert config.port == DefaultValues.DEFAULT_PORT
\ No newline at end of file
@@ -22,7 +22,6 @@ class TestHealthCheck:
         )
         return service
 
-    @pytest.mark.asyncio
     async def test_health_check_success_with_ecologits(self, mock_health_service):
         """Test health check when EcoLogits is available."""
         from src.api.routes.health import health_check
@@ -40,7 +39,6 @@ class TestHealthCheck:
             assert result["dependencies"]["ecologits"] == "available"
             assert result["dependencies"]["available_models"] == 3
 
-    @pytest.mark.asyncio
     async def test_health_check_ecologits_list_models_error_directly(self, mock_health_service):
         """Test health check when EcoLogits models.list_models fails."""
         from src.api.routes.health import health_check
@@ -56,7 +54,6 @@ class TestHealthCheck:
         assert "ecologits" in result["dependencies"]
         assert "available_models" in result["dependencies"]
 
-    @pytest.mark.asyncio
     async def test_health_check_ecologits_list_models_error(self, mock_health_service):
         """Test health check when EcoLogits list_models fails."""
         from src.api.routes.health import health_check
@@ -86,7 +83,6 @@ class TestGetSupportedModels:
         )
         return service
 
-    @pytest.mark.asyncio
     async def test_get_supported_models(self, mock_model_info_service):
         """Test getting supported models."""
         from src.api.routes.health import get_supported_models
@@ -100,7 +96,6 @@ class TestGetSupportedModels:
 class TestDebugModelsStructure:
     """Test debug models structure endpoint."""
 
-    @pytest.mark.asyncio
     async def test_debug_models_structure_success(self):
         """Test debug endpoint when EcoLogits is available."""
         from src.api.routes.health import debug_models_structure
@@ -122,7 +117,6 @@ class TestDebugModelsStructure:
                 assert result["model_repository_info"]["has_keys_method"] is True
                 assert result["model_repository_info"]["is_dict_like"] is True
 
-    @pytest.mark.asyncio
     async def test_debug_models_structure_basic_functionality(self):
         """Test debug endpoint basic functionality."""
         from src.api.routes.health import debug_models_structure
@@ -136,7 +130,6 @@ class TestDebugModelsStructure:
         is_success_response = "model_repository_info" in result
         assert is_error_response or is_success_response
 
-    @pytest.mark.asyncio
     async def test_debug_models_structure_attribute_error(self):
         """Test debug endpoint when attributes cause errors."""
         from src.api.routes.health import debug_models_structure
@@ -195,7 +188,6 @@ class TestCreateTestRouter:
         assert router.routes[0].path == "/test"
         assert "GET" in router.routes[0].methods
 
-    @pytest.mark.asyncio
     async def test_test_calculation_development(self, mock_config_development, mock_test_service):
         """Test test calculation endpoint in development environment."""
         router = create_test_router()
@@ -223,7 +215,6 @@ class TestCreateTestRouter:
         
         mock_test_service.run_test_calculation.assert_called_once_with("development")
 
-    @pytest.mark.asyncio
     async def test_test_calculation_production_raises_404(self, mock_config_production, mock_test_service):
         """Test test calculation endpoint raises 404 in production."""
         router = create_test_router()
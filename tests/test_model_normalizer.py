@@ -1,11 +1,6 @@
 """Unit tests for model normalization functions."""
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add the parent directory to the path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.domain.model_normalizer import (
     normalize_model_name,
@@ -17,96 +12,88 @@ from src.domain.model_normalizer import (
 class TestNormalizeModelName:
     """Test the normalize_model_name function."""
     
-    def test_gpt_variations(self):
+    @pytest.mark.parametrize("input_name,expected", [
+        ("gpt4o", "gpt-4o"),
+        ("gpt-4o", "gpt-4o"),  # Already correct
+        ("GPT4O", "gpt-4o"),   # Case insensitive
+        ("gpt4omini", "gpt-4o-mini"),
+        ("gpt-4omini", "gpt-4o-mini"),
+        ("gpt4o-mini", "gpt-4o-mini"),
+        ("gpt35turbo", "gpt-3.5-turbo"),
+        ("gpt-35-turbo", "gpt-3.5-turbo"),
+        ("gpt3.5turbo", "gpt-3.5-turbo"),
+        ("gpt4", "gpt-4"),
+    ])
+    def test_gpt_variations(self, input_name, expected):
         """Test GPT model variations are normalized correctly."""
-        test_cases = [
-            ("gpt4o", "gpt-4o"),
-            ("gpt-4o", "gpt-4o"),  # Already correct
-            ("GPT4O", "gpt-4o"),   # Case insensitive
-            ("gpt4omini", "gpt-4o-mini"),
-            ("gpt-4omini", "gpt-4o-mini"),
-            ("gpt4o-mini", "gpt-4o-mini"),
-            ("gpt35turbo", "gpt-3.5-turbo"),
-            ("gpt-35-turbo", "gpt-3.5-turbo"),
-            ("gpt3.5turbo", "gpt-3.5-turbo"),
-            ("gpt4", "gpt-4"),
-        ]
-        
-        for input_name, expected in test_cases:
-            result = normalize_model_name(input_name)
-            assert result == expected, f"Expected '{input_name}' -> '{expected}', got '{result}'"
-    
-    def test_claude_variations(self):
+        assert normalize_model_name(input_name) == expected
+    
+    @pytest.mark.parametrize("input_name,expected", [
+        ("claudeopus", "claude-3-opus"),
+        ("claude3opus", "claude-3-opus"),
+        ("claude-3opus", "claude-3-opus"),
+        ("claudesonnet", "claude-3-sonnet"),
+        ("claude3sonnet", "claude-3-sonnet"),
+        ("claude-3sonnet", "claude-3-sonnet"),
+        ("claudehaiku", "claude-3-haiku"),
+        ("claude3haiku", "claude-3-haiku"),
+        ("claude35sonnet", "claude-3-5-sonnet"),
+        ("claude-35-sonnet", "claude-3-5-sonnet"),
+        ("claude3.5sonnet", "claude-3-5-sonnet"),
+    ])
+    def test_claude_variations(self, input_name, expected):
         """Test Claude model variations are normalized correctly."""
-        test_cases = [
-            ("claudeopus", "claude-3-opus"),
-            ("claude3opus", "claude-3-opus"),
-            ("claude-3opus", "claude-3-opus"),
-            ("claudesonnet", "claude-3-sonnet"),
-            ("claude3sonnet", "claude-3-sonnet"),
-            ("claude-3sonnet", "claude-3-sonnet"),
-            ("claudehaiku", "claude-3-haiku"),
-            ("claude3haiku", "claude-3-haiku"),
-            ("claude35sonnet", "claude-3-5-sonnet"),
-            ("claude-35-sonnet", "claude-3-5-sonnet"),
-            ("claude3.5sonnet", "claude-3-5-sonnet"),
-        ]
-        
-        for input_name, expected in test_cases:
-            result = normalize_model_name(input_name)
-            assert result == expected, f"Expected '{input_name}' -> '{expected}', got '{result}'"
-    
-    def test_gemini_variations(self):
+        assert normalize_model_name(input_name) == expected
+    
+    @pytest.mark.parametrize("input_name,expected", [
+        ("geminipro", "gemini-pro"),
+        ("gemini1.5pro", "gemini-1.5-pro"),
+        ("gemini15pro", "gemini-1.5-pro"),
+        ("gemini-15-pro", "gemini-1.5-pro"),
+    ])
+    def test_gemini_variations(self, input_name, expected):
         """Test Gemini model variations are normalized correctly."""
-        test_cases = [
-            ("geminipro", "gemini-pro"),
-            ("gemini1.5pro", "gemini-1.5-pro"),
-            ("gemini15pro", "gemini-1.5-pro"),
-            ("gemini-15-pro", "gemini-1.5-pro"),
-        ]
-        
-        for input_name, expected in test_cases:
-            result = normalize_model_name(input_name)
-            assert result == expected, f"Expected '{input_name}' -> '{expected}', got '{result}'"
-    
-    def test_case_insensitive(self):
+        assert normalize_model_name(input_name) == expected
+    
+    @pytest.mark.parametrize("input_name,expected", [
+        ("GPT4O", "gpt-4o"),
+        ("ClaudeOpus", "claude-3-opus"),
+        ("GEMINIPRO", "gemini-pro"),
+        ("gPt4O", "gpt-4o"),
+    ])
+    def test_case_insensitive(self, input_name, expected):
         """Test that normalization is case insensitive."""
-        test_cases = [
-            ("GPT4O", "gpt-4o"),
-            ("ClaudeOpus", "claude-3-opus"),
-            ("GEMINIPRO", "gemini-pro"),
-            ("gPt4O", "gpt-4o"),
-        ]
-        
-        for input_name, expected in test_cases:
-            result = normalize_model_name(input_name)
-            assert result == expected, f"Expected '{input_name}' -> '{expected}', got '{result}'"
-    
-    def test_whitespace_handling(self):
+        assert normalize_model_name(input_name) == expected
+    
+    @pytest.mark.parametrize("input_name,expected", [
+        ("  gpt4o  ", "gpt-4o"),
+        (" claudeopus ", "claude-3-opus"),
+        ("gpt4o\n", "gpt-4o"),
+        ("\tgeminipro\t", "gemini-pro"),
+    ])
+    def test_whitespace_handling(self, input_name, expected):
         """Test that whitespace is stripped properly."""
-        test_cases = [
-            ("  gpt4o  ", "gpt-4o"),
-            (" claudeopus ", "claude-3-opus"),
-            ("gpt4o\n", "gpt-4o"),
-            ("\tgeminipro\t", "gemini-pro"),
-        ]
-        
-        for input_name, expected in test_cases:
-            result = normalize_model_name(input_name)
-            assert result == expected, f"Expected '{input_name}' -> '{expected}', got '{result}'"
-    
-    def test_unknown_models_unchanged(self):
+        assert normalize_model_name(input_name) == expected
+    
+    @pytest.mark.parametrize("model_name", [
+        "unknown-model",
+        "random-name",
+        "not-a-model",
+        "xyz-123",
+    ])
+    def test_unknown_models_unchanged(self, model_name):
         """Test that unknown model names are returned unchanged."""
-        test_cases = [
-            "unknown-model",
-            "random-name",
-            "not-a-model",
-            "xyz-123"
-        ]
+        assert normalize_model_name(model_name) == model_name
+    
+    def test_repeated_calls_are_cached(self):
+        """Test that repeated lookups of the same name hit the cache."""
+        normalize_model_name.cache_clear()
+        normalize_model_name("GPT4O")
+        normalize_model_name("GPT4O")
         
-        for model_name in test_cases:
-            result = normalize_model_name(model_name)
-            assert result == model_name, f"Unknown model '{model_name}' should be unchanged"
+        info = normalize_model_name.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
     
     def test_empty_and_none_input(self):
         """Test edge cases with empty or None input."""
@@ -114,22 +101,19 @@ class TestNormalizeModelName:
         assert normalize_model_name("   ") == "   "  # Preserve whitespace-only input
         assert normalize_model_name(None) == None
     
-    def test_already_correct_models_unchanged(self):
+    @pytest.mark.parametrize("model_name", [
+        "gpt-4o",
+        "gpt-4o-mini",
+        "claude-3-opus",
+        "claude-3-sonnet",
+        "claude-3-haiku",
+        "claude-3-5-sonnet",
+        "gemini-pro",
+        "gemini-1.5-pro",
+    ])
+    def test_already_correct_models_unchanged(self, model_name):
         """Test that correctly formatted model names are unchanged."""
-        correct_names = [
-            "gpt-4o",
-            "gpt-4o-mini", 
-            "claude-3-opus",
-            "claude-3-sonnet",
-            "claude-3-haiku",
-            "claude-3-5-sonnet",
-            "gemini-pro",
-            "gemini-1.5-pro"
-        ]
-        
-        for model_name in correct_names:
-            result = normalize_model_name(model_name)
-            assert result == model_name, f"Correct model '{model_name}' should be unchanged"
+        assert normalize_model_name(model_name) == model_name
 
 
 class TestFindSimilarModels:
@@ -1,56 +1,61 @@
 """Integration tests for refactored API."""
 
+import asyncio
+
+import orjson
 import pytest
-import json
-import hashlib
-import hmac
-from fastapi.testclient import TestClient
 
-from src.application import create_app
+# Model mapping keys of the app_config fixture
+_EXPECTED_MODELS = frozenset({"gpt-4o", "test-model"})
 
 
 class TestRefactoredAPI:
     """Test the refactored API endpoints."""
 
-    def test_health_endpoint(self, client):
-        """Test health check endpoint."""
-        response = client.get("/health")
+    async def test_readonly_endpoints_batch(self, mocked_repo_client):
+        """Test health, models and docs endpoints with one concurrent batch of GETs."""
+        health, models, docs = await asyncio.gather(
+            mocked_repo_client.get("/health"),
+            mocked_repo_client.get("/models"),
+            mocked_repo_client.get("/docs"),
+        )
         
-        assert response.status_code == 200
-        data = response.json()
+        assert health.status_code == 200
+        data = orjson.loads(health.content)
         assert data["status"] == "healthy"
         assert data["service"] == "ecologits-webhook"
         assert "timestamp" in data
-
-    def test_models_endpoint(self, client):
-        """Test supported models endpoint."""
-        response = client.get("/models")
         
-        assert response.status_code == 200
-        data = response.json()
+        assert models.status_code == 200
+        data = orjson.loads(models.content)
         assert "supported_models" in data
         assert "total_ecologits_models" in data
         assert isinstance(data["supported_models"], list)
+        supported = frozenset(data["supported_models"])
+        assert _EXPECTED_MODELS.issubset(supported), f"missing: {_EXPECTED_MODELS - supported}"
+        
+        # API docs are available in test environment
+        assert docs.status_code == 200
 
-    def test_calculate_endpoint_success(self, client, sample_usage_request):
+    async def test_calculate_endpoint_success(self, mocked_repo_client, sample_usage_request):
         """Test successful calculation request."""
-        response = client.post("/calculate", json=sample_usage_request)
+        response = await mocked_repo_client.post("/calculate", json=sample_usage_request)
         
         assert response.status_code == 200
-        data = response.json()
+        data = orjson.loads(response.content)
         
         assert data["model"] == "gpt-4o"
         assert data["input_tokens"] == 1000
         assert data["output_tokens"] == 500
         assert data["total_tokens"] == 1500
-        assert data["energy_kwh"] > 0  # Should have some energy value
-        assert data["gwp_kgco2eq"] > 0  # Should have some GWP value
+        assert data["energy_kwh"] > 0
+        assert data["gwp_kgco2eq"] > 0
         assert data["success"] is True
         assert data["error"] is None
         assert data["calculation_id"].startswith("calc-")
         assert "timestamp" in data
 
-    def test_calculate_endpoint_invalid_model(self, client):
+    async def test_calculate_endpoint_invalid_model(self, mocked_repo_client):
         """Test calculation with invalid model name."""
         payload = {
             "model": "gpt-4o@invalid!",
@@ -58,10 +63,10 @@ class TestRefactoredAPI:
             "output_tokens": 500
         }
         
-        response = client.post("/calculate", json=payload)
+        response = await mocked_repo_client.post("/calculate", json=payload)
         assert response.status_code == 422
 
-    def test_calculate_endpoint_negative_tokens(self, client):
+    async def test_calculate_endpoint_negative_tokens(self, mocked_repo_client):
         """Test calculation with negative tokens."""
         payload = {
             "model": "gpt-4o",
@@ -69,10 +74,5 @@ class TestRefactoredAPI:
             "output_tokens": 500
         }
         
-        response = client.post("/calculate", json=payload)
+        response = await mocked_repo_client.post("/calculate", json=payload)
         assert response.status_code == 422
-
-    def test_docs_available_in_test_environment(self, client):
-        """Test that API docs are available in test environment."""
-        response = client.get("/docs")
-        assert response.status_code == 200
\ No newline at end of file
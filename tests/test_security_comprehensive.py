@@ -73,6 +73,19 @@ class TestVerifyApiKey:
         assert exc_info.value.status_code == HTTPStatus.UNAUTHORIZED
         assert exc_info.value.detail == ErrorMessages.API_KEY_REQUIRED
     
+    def test_rejection_does_not_leak_earlier_context(self, config_auth_enabled):
+        """Test a rejection carries no __context__ from an earlier request's exception."""
+        try:
+            {}["missing"]
+        except KeyError:
+            with pytest.raises(HTTPException):
+                verify_api_key(config_auth_enabled, None)
+        
+        with pytest.raises(HTTPException) as exc_info:
+            verify_api_key(config_auth_enabled, None)
+        
+        assert exc_info.value.__context__ is None
+    
     def test_auth_enabled_no_api_key_configured_raises_500(self, config_auth_enabled_no_key):
         """Test that missing API key config raises 500 - critical misconfiguration."""
         credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="any-key")
@@ -199,6 +212,15 @@ class TestVerifyWebhookSignature:
         result = verify_webhook_signature(config_webhook_enabled, request, body)
         assert result is True
     
+    def test_webhook_repeated_verification_uses_fresh_state(self, config_webhook_enabled):
+        """Test that consecutive bodies are each signed from the clean keyed state."""
+        for body in (b"first body", b"second body", b"first body"):
+            signature = hmac.new(b"webhook-secret-key", body, hashlib.sha256).hexdigest()
+            request = Mock(spec=Request)
+            request.headers.get.return_value = f"sha256={signature}"
+            
+            assert verify_webhook_signature(config_webhook_enabled, request, body) is True
+    
     def test_webhook_invalid_signature_raises_401(self, config_webhook_enabled, mock_request_with_signature):
         """Test that invalid webhook signature raises 401."""
         # mock_request_with_signature has "sha256=test-signature" which will be invalid
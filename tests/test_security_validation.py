@@ -1,9 +1,9 @@
 """Tests for security validation of model names."""
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 from src.domain.services import ImpactCalculationService
-from src.config.settings import AppConfig
 
 
 class TestSecurityValidation:
@@ -18,10 +18,8 @@ class TestSecurityValidation:
 
     @pytest.fixture
     def mock_config(self):
-        """Create mock config."""
-        config = Mock(spec=AppConfig)
-        config.model_mappings = {}
-        return config
+        """Create mock config; the service only reads model_mappings."""
+        return SimpleNamespace(model_mappings={})
 
     @pytest.fixture
     def service(self, mock_ecologits_repo, mock_config):
@@ -1,11 +1,6 @@
 """Simple tests for CI/CD validation."""
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add the parent directory to the path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
 def test_imports():
@@ -63,11 +58,9 @@ def test_impact_response_creation():
     assert response.success is True
 
 
-def test_application_creation():
+def test_application_creation(session_app):
     """Test that application can be created."""
-    from src.application import create_app
-    
-    # This will fail if there are import or configuration issues
-    app = create_app()
+    # The session fixture fails if there are import or configuration issues
+    app, _ = session_app
     assert app is not None
     assert app.title == "EcoLogits Webhook"
\ No newline at end of file